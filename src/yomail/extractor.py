@@ -4,9 +4,12 @@ Provides three extraction methods:
 - extract(): Strict extraction, raises on failure
 - extract_safe(): Safe extraction, returns None on failure
 - extract_with_metadata(): Full result with debugging info
+
+extract_batch() applies extract_with_metadata() to many emails.
 """
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -78,19 +81,22 @@ class EmailBodyExtractor:
         self,
         model_path: Path | str | None = None,
         confidence_threshold: float = 0.5,
+        use_default: bool = True,
     ) -> None:
         """Initialize the extractor.
 
         Args:
             model_path: Path to trained CRF model. If None, uses the bundled model.
             confidence_threshold: Minimum confidence to accept extraction.
+            use_default: If True and model_path is None, load the bundled model.
+                Set to False to start without a model, e.g. before load_model_bytes().
         """
         # Pipeline components
         self._normalizer = Normalizer()
         self._content_filter = ContentFilter()
         self._structural_analyzer = StructuralAnalyzer()
         self._feature_extractor = FeatureExtractor()
-        self._crf_labeler = CRFSequenceLabeler(model_path, use_default=(model_path is None))
+        self._crf_labeler = CRFSequenceLabeler(model_path, use_default=use_default)
         self._reconstructor = Reconstructor()
         self._body_assembler = BodyAssembler()
 
@@ -106,6 +112,20 @@ class EmailBodyExtractor:
         self._crf_labeler.load_model(model_path)
         self._model_path = Path(model_path)
 
+    def load_model_bytes(self, model_data: bytes) -> None:
+        """Load a CRF model from memory.
+
+        Args:
+            model_data: Contents of a .crfsuite model file.
+        """
+        self._crf_labeler.load_model_bytes(model_data)
+        self._model_path = None
+
+    def unload_model(self) -> None:
+        """Close the loaded CRF model and release its resources."""
+        self._crf_labeler.unload_model()
+        self._model_path = None
+
     @property
     def is_model_loaded(self) -> bool:
         """Whether a model is currently loaded."""
@@ -152,6 +172,19 @@ class EmailBodyExtractor:
             logger.exception("Unexpected error during extraction")
             return None
 
+    def extract_batch(self, email_texts: Iterable[str]) -> list[ExtractionResult]:
+        """Extract bodies with full metadata from many emails.
+
+        Equivalent to calling extract_with_metadata() on each email in order.
+
+        Args:
+            email_texts: Raw email texts.
+
+        Returns:
+            One ExtractionResult per input email, in input order.
+        """
+        return [self.extract_with_metadata(email_text) for email_text in email_texts]
+
     def extract_with_metadata(self, email_text: str) -> ExtractionResult:
         """Extract body with full metadata.
 
@@ -0,0 +1,26 @@
+"""Helpers for merging pattern tables into a single compiled regex."""
+
+import re
+from collections.abc import Iterable
+
+
+def combine_patterns(patterns: Iterable[re.Pattern[str]]) -> re.Pattern[str]:
+    """Merge patterns into one alternation that matches where any of them would.
+
+    Each pattern is wrapped in a non-capturing group, and its IGNORECASE flag
+    is carried over as a scoped inline flag, so a single ``match``/``search``
+    call replaces a Python-level ``any(...)`` loop over the table.
+
+    Args:
+        patterns: Compiled patterns without flags other than IGNORECASE.
+
+    Returns:
+        A compiled pattern equivalent to trying each input pattern in turn.
+    """
+    parts = []
+    for pattern in patterns:
+        if pattern.flags & re.IGNORECASE:
+            parts.append(f"(?i:{pattern.pattern})")
+        else:
+            parts.append(f"(?:{pattern.pattern})")
+    return re.compile("|".join(parts))
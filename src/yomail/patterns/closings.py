@@ -5,6 +5,8 @@ Patterns match against neologdn-normalized text.
 
 import re
 
+from yomail.patterns._combine import combine_patterns
+
 # Sentence-ending punctuation (formal and informal)
 # Includes: period (。.), exclamation (!！), tilde (〜~)
 _PUNCT = r"[。.!！〜~]"
@@ -50,6 +52,8 @@ _CLOSING_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(rf"^.*失礼します{_PUNCT}?$"),
 )
 
+_CLOSING_RE = combine_patterns(_CLOSING_PATTERNS)
+
 
 def is_closing_line(line: str) -> bool:
     """Check if a line matches a closing pattern.
@@ -64,4 +68,4 @@ def is_closing_line(line: str) -> bool:
     if not stripped:
         return False
 
-    return any(pattern.match(stripped) for pattern in _CLOSING_PATTERNS)
+    return _CLOSING_RE.match(stripped) is not None
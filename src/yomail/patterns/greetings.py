@@ -8,6 +8,8 @@ Patterns match against neologdn-normalized text, so:
 
 import re
 
+from yomail.patterns._combine import combine_patterns
+
 # Greeting patterns - common Japanese email opening formulas
 # These are compiled at module load time for efficiency
 _GREETING_PATTERNS: tuple[re.Pattern[str], ...] = (
@@ -48,6 +50,8 @@ _GREETING_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"^おはようございます[。.]?$"),
 )
 
+_GREETING_RE = combine_patterns(_GREETING_PATTERNS)
+
 
 def is_greeting_line(line: str) -> bool:
     """Check if a line matches a greeting pattern.
@@ -62,4 +66,4 @@ def is_greeting_line(line: str) -> bool:
     if not stripped:
         return False
 
-    return any(pattern.match(stripped) for pattern in _GREETING_PATTERNS)
+    return _GREETING_RE.match(stripped) is not None
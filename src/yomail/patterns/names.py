@@ -64,6 +64,31 @@ def _get_name_sets() -> tuple[frozenset[str], frozenset[str], frozenset[str], fr
     )
 
 
+@lru_cache(maxsize=1)
+def _get_romaji_names_lower() -> frozenset[str]:
+    """Get lowercased romaji names for case-insensitive containment checks."""
+    return frozenset(name.lower() for name in _get_name_sets()[3])
+
+
+@lru_cache(maxsize=None)
+def _get_name_lengths(names: frozenset[str]) -> tuple[int, ...]:
+    """Get the distinct lengths of the names in a name set."""
+    return tuple(sorted({len(name) for name in names}))
+
+
+def _contains_name_from(text: str, names: frozenset[str]) -> bool:
+    """Check if any name in the set occurs as a substring of text.
+
+    Probes only substrings whose length some name actually has, so the cost
+    is a few hash lookups per character instead of a scan over every name.
+    """
+    for length in _get_name_lengths(names):
+        for start in range(len(text) - length + 1):
+            if text[start : start + length] in names:
+                return True
+    return False
+
+
 # Pattern for name with reading: 田中太郎 (タナカタロウ) or 田中太郎(タナカタロウ)
 _NAME_WITH_READING_PATTERN = re.compile(
     r"^([^\s(（]+)\s*[（(]([ァ-ヶー\s]+)[）)]$"
@@ -79,6 +104,9 @@ _ROMAJI_NAME_PATTERN = re.compile(
     r"^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$"
 )
 
+# Sentence punctuation that rules out a bare-name line
+_NAME_PUNCTUATION_PATTERN = re.compile(r"[。、！？!?,.:;]")
+
 
 def is_name_line(line: str) -> bool:
     """Check if a line appears to be a personal name (signature-style).
@@ -113,23 +141,22 @@ def is_name_line(line: str) -> bool:
 
     # For short lines, check if they contain known names
     # Only check lines that look like they could be just a name (short, no punctuation)
-    if len(stripped) <= 15 and not any(c in stripped for c in "。、！？!?,.:;"):
+    if len(stripped) <= 15 and not _NAME_PUNCTUATION_PATTERN.search(stripped):
         last_names, first_names, katakana_names, romaji_names = _get_name_sets()
 
+        # Split points of the (short) line; each side is a hash lookup
+        splits = [(stripped[:i], stripped[i:]) for i in range(len(stripped) + 1)]
+
         # Check for full name (last + first, Japanese order)
-        for last in last_names:
-            if stripped.startswith(last):
-                remainder = stripped[len(last):]
-                # Remainder should be a first name or empty (last name only)
-                if not remainder or remainder in first_names:
-                    return True
+        for prefix, remainder in splits:
+            # Remainder should be a first name or empty (last name only)
+            if prefix in last_names and (not remainder or remainder in first_names):
+                return True
 
         # Check for full name (first + last, Western order)
-        for first in first_names:
-            if stripped.startswith(first):
-                remainder = stripped[len(first):]
-                if remainder in last_names:
-                    return True
+        for prefix, remainder in splits:
+            if prefix in first_names and remainder in last_names:
+                return True
 
         # Check for katakana name
         if stripped in katakana_names:
@@ -159,22 +186,15 @@ def contains_known_name(line: str) -> bool:
     if not stripped:
         return False
 
-    last_names, first_names, katakana_names, romaji_names = _get_name_sets()
+    last_names, _first_names, katakana_names, _romaji_names = _get_name_sets()
 
     # Check for any known last name
-    for name in last_names:
-        if name in stripped:
-            return True
+    if _contains_name_from(stripped, last_names):
+        return True
 
     # Check for katakana names
-    for name in katakana_names:
-        if name in stripped:
-            return True
+    if _contains_name_from(stripped, katakana_names):
+        return True
 
     # Check for romaji names (case insensitive for contains check)
-    stripped_lower = stripped.lower()
-    for name in romaji_names:
-        if name.lower() in stripped_lower:
-            return True
-
-    return False
+    return _contains_name_from(stripped.lower(), _get_romaji_names_lower())
@@ -10,6 +10,8 @@ Note: Visual separator detection is in separators.py
 
 import re
 
+from yomail.patterns._combine import combine_patterns
+
 # Contact information patterns
 _CONTACT_PATTERNS: tuple[re.Pattern[str], ...] = (
     # Phone patterns (after normalization, TEL/Tel are ASCII)
@@ -83,6 +85,10 @@ _POSITION_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"Engineer", re.IGNORECASE),
 )
 
+_CONTACT_RE = combine_patterns(_CONTACT_PATTERNS)
+_COMPANY_RE = combine_patterns(_COMPANY_PATTERNS)
+_POSITION_RE = combine_patterns(_POSITION_PATTERNS)
+
 
 def is_contact_info_line(line: str) -> bool:
     """Check if a line contains contact information.
@@ -96,7 +102,7 @@ def is_contact_info_line(line: str) -> bool:
     if not line.strip():
         return False
 
-    return any(pattern.search(line) for pattern in _CONTACT_PATTERNS)
+    return _CONTACT_RE.search(line) is not None
 
 
 def is_company_line(line: str) -> bool:
@@ -111,7 +117,7 @@ def is_company_line(line: str) -> bool:
     if not line.strip():
         return False
 
-    return any(pattern.search(line) for pattern in _COMPANY_PATTERNS)
+    return _COMPANY_RE.search(line) is not None
 
 
 def is_position_line(line: str) -> bool:
@@ -126,4 +132,4 @@ def is_position_line(line: str) -> bool:
     if not line.strip():
         return False
 
-    return any(pattern.search(line) for pattern in _POSITION_PATTERNS)
+    return _POSITION_RE.search(line) is not None
@@ -4,7 +4,7 @@ Separates blank lines from content lines before ML processing.
 Blank lines are reinserted after labeling using the WhitespaceMap.
 """
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 
 from yomail.pipeline.normalizer import NormalizedEmail
 
@@ -75,50 +75,32 @@ class ContentFilter:
         Returns:
             FilteredContent with content lines and whitespace map.
         """
-        content_lines: list[ContentLine] = []
-        blank_positions: set[int] = set()
-        content_to_original: list[int] = []
-
-        # First pass: identify content vs blank, track blank_lines_before
-        pending_blanks = 0
-
-        for orig_idx, text in enumerate(normalized.lines):
-            if text.strip():
-                # Content line
-                content_lines.append(
-                    ContentLine(
-                        text=text,
-                        original_index=orig_idx,
-                        blank_lines_before=pending_blanks,
-                        blank_lines_after=0,  # Set in second pass
-                    )
-                )
-                content_to_original.append(orig_idx)
-                pending_blanks = 0
-            else:
-                # Blank line (empty or whitespace-only)
-                blank_positions.add(orig_idx)
-                pending_blanks += 1
-
-        # Second pass: set blank_lines_after for each content line
-        for i in range(len(content_lines) - 1):
-            curr_orig = content_lines[i].original_index
-            next_orig = content_lines[i + 1].original_index
-            blanks_between = next_orig - curr_orig - 1
-            content_lines[i] = replace(content_lines[i], blank_lines_after=blanks_between)
-
-        # Last content line: count trailing blanks
-        if content_lines:
-            last_orig = content_lines[-1].original_index
-            trailing_blanks = len(normalized.lines) - last_orig - 1
-            content_lines[-1] = replace(content_lines[-1], blank_lines_after=trailing_blanks)
+        lines = normalized.lines
+        line_count = len(lines)
+
+        # Content lines are non-blank; blank means empty or whitespace-only
+        content_to_original = tuple(idx for idx, text in enumerate(lines) if text.strip())
+
+        # Blank runs around each content line end at its content neighbours (or the document edges)
+        previous_indices = (-1, *content_to_original[:-1])
+        next_indices = (*content_to_original[1:], line_count)
+
+        content_lines = tuple(
+            ContentLine(
+                text=lines[orig_idx],
+                original_index=orig_idx,
+                blank_lines_before=orig_idx - prev_idx - 1,
+                blank_lines_after=next_idx - orig_idx - 1,
+            )
+            for prev_idx, orig_idx, next_idx in zip(previous_indices, content_to_original, next_indices)
+        )
 
         return FilteredContent(
-            content_lines=tuple(content_lines),
+            content_lines=content_lines,
             whitespace_map=WhitespaceMap(
-                content_to_original=tuple(content_to_original),
-                blank_positions=frozenset(blank_positions),
-                original_line_count=len(normalized.lines),
+                content_to_original=content_to_original,
+                blank_positions=frozenset(range(line_count)).difference(content_to_original),
+                original_line_count=line_count,
             ),
-            original_lines=normalized.lines,
+            original_lines=lines,
         )
@@ -226,6 +226,7 @@ class CRFSequenceLabeler:
         """
         self._tagger: pycrfsuite.Tagger | None = None
         self._model_path: Path | None = None
+        self._model_data: bytes | None = None  # Backing buffer for in-memory models
         self._resource_context = None  # Keep resource context alive
 
         if model_path is not None:
@@ -247,6 +248,9 @@ class CRFSequenceLabeler:
         if not path.exists():
             raise FileNotFoundError(f"Model file not found: {path}")
 
+        # Release any previously loaded model before replacing it
+        self.unload_model()
+
         self._tagger = pycrfsuite.Tagger()
         try:
             self._tagger.open(str(path))
@@ -255,8 +259,37 @@ class CRFSequenceLabeler:
             raise RuntimeError(f"Failed to load CRF model: {exc}") from exc
 
         self._model_path = path
+        self._model_data = None
         logger.info("Loaded CRF model from %s", path)
 
+    def load_model_bytes(self, model_data: bytes) -> None:
+        """Load a trained CRF model from memory.
+
+        Useful when the model is already in memory (e.g. fetched from a
+        remote store or shared between many labelers) and writing it to
+        disk first would be wasted I/O.
+
+        Args:
+            model_data: Contents of a .crfsuite model file.
+
+        Raises:
+            RuntimeError: If the model cannot be loaded.
+        """
+        # Release any previously loaded model before replacing it
+        self.unload_model()
+
+        self._tagger = pycrfsuite.Tagger()
+        try:
+            self._tagger.open_inmemory(model_data)
+        except Exception as exc:
+            self._tagger = None
+            raise RuntimeError(f"Failed to load CRF model: {exc}") from exc
+
+        # crfsuite reads the model in place, so the buffer must outlive the tagger
+        self._model_data = model_data
+        self._model_path = None
+        logger.info("Loaded CRF model from memory (%d bytes)", len(model_data))
+
     def _load_default_model(self) -> None:
         """Load the bundled default model."""
         data_files = resources.files("yomail.data")
@@ -277,6 +310,21 @@ class CRFSequenceLabeler:
         self._model_path = path
         logger.info("Loaded bundled CRF model")
 
+    def unload_model(self) -> None:
+        """Close the loaded model and release its resources.
+
+        Frees the crfsuite model held by the tagger without waiting for
+        garbage collection. Safe to call when no model is loaded.
+        """
+        if self._tagger is not None:
+            self._tagger.close()
+            self._tagger = None
+        if self._resource_context is not None:
+            self._resource_context.__exit__(None, None, None)
+            self._resource_context = None
+        self._model_path = None
+        self._model_data = None
+
     @property
     def is_loaded(self) -> bool:
         """Whether a model is currently loaded."""
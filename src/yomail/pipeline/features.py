@@ -14,8 +14,10 @@ import re
 import unicodedata
 from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Sequence
 
+from yomail.patterns._combine import combine_patterns
 from yomail.patterns.closings import is_closing_line
 from yomail.patterns.greetings import is_greeting_line
 from yomail.patterns.names import is_name_line
@@ -118,6 +120,8 @@ _META_DISCUSSION_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"前述の"),
 )
 
+_META_DISCUSSION_RE = combine_patterns(_META_DISCUSSION_PATTERNS)
+
 # Japanese quotation mark pairs
 _QUOTATION_PAIRS = (
     ("「", "」"),
@@ -127,6 +131,43 @@ _QUOTATION_PAIRS = (
 )
 
 
+# Character classes tracked by the content ratio features
+_CHARACTER_CLASSES = ("kanji", "hiragana", "katakana", "ascii", "digit", "symbol")
+
+
+@lru_cache(maxsize=8192)
+def _classify_character(char: str) -> str:
+    """Classify a character into one of the tracked categories.
+
+    Cached per character: emails draw on a small working set of code points,
+    so the Unicode name lookup runs once per distinct character.
+    """
+    # Check ASCII first (most common in mixed text)
+    if char.isascii():
+        if char.isdigit():
+            return "digit"
+        if char.isalpha():
+            return "ascii"
+        return "symbol"
+
+    # Use Unicode name for Japanese character classification
+    try:
+        name = unicodedata.name(char, "")
+    except ValueError:
+        return "symbol"
+
+    if "CJK UNIFIED IDEOGRAPH" in name or "CJK COMPATIBILITY IDEOGRAPH" in name:
+        return "kanji"
+    if "HIRAGANA" in name:
+        return "hiragana"
+    if "KATAKANA" in name:
+        return "katakana"
+    if char.isdigit():
+        return "digit"
+
+    return "symbol"
+
+
 def _separators_match(a: str, b: str) -> bool:
     """Check if two separators are similar enough to form a bracket pair.
 
@@ -286,7 +327,7 @@ class FeatureExtractor:
             return ExtractedFeatures(line_features=(), total_lines=0)
 
         # Pre-compute per-line pattern flags for contextual features
-        line_flags = [self._compute_pattern_flags(line) for line in lines]
+        line_flags = [self.match_patterns(line.text) for line in lines]
 
         # Detect bracketed sections (late pass)
         bracketed_indices, bracket_ranges = _find_bracketed_sections(lines, line_flags)
@@ -417,10 +458,18 @@ class FeatureExtractor:
             bracket_has_signature_patterns=bracket_has_signature_patterns,
         )
 
-    def _compute_pattern_flags(self, annotated_line: AnnotatedLine) -> dict[str, bool]:
-        """Compute pattern flags for a content line."""
-        text = annotated_line.text
+    def match_patterns(self, text: str) -> dict[str, bool]:
+        """Run the line-level pattern matchers on a single normalized line.
 
+        These flags depend only on the line text, so callers that need
+        nothing else can skip content filtering and structural analysis.
+
+        Args:
+            text: A single normalized line of text.
+
+        Returns:
+            Dict mapping pattern flag names (matching LineFeatures fields) to bools.
+        """
         return {
             "is_greeting": is_greeting_line(text),
             "is_closing": is_closing_line(text),
@@ -439,61 +488,31 @@ class FeatureExtractor:
         Returns ratios for: kanji, hiragana, katakana, ascii, digit, symbol.
         """
         if not text:
+            return dict.fromkeys(_CHARACTER_CLASSES, 0.0)
+
+        total = len(text)
+
+        # ASCII-only lines cannot contain kanji or kana; skip per-character lookup
+        if text.isascii():
+            digit = sum(map(str.isdigit, text))
+            alpha = sum(map(str.isalpha, text))
             return {
                 "kanji": 0.0,
                 "hiragana": 0.0,
                 "katakana": 0.0,
-                "ascii": 0.0,
-                "digit": 0.0,
-                "symbol": 0.0,
+                "ascii": alpha / total,
+                "digit": digit / total,
+                "symbol": (total - alpha - digit) / total,
             }
 
-        counts = {
-            "kanji": 0,
-            "hiragana": 0,
-            "katakana": 0,
-            "ascii": 0,
-            "digit": 0,
-            "symbol": 0,
-        }
-
-        for char in text:
-            category = self._classify_character(char)
-            counts[category] += 1
+        # Counter consumes the cached classifications in a single C-level pass
+        counts = Counter(map(_classify_character, text))
 
-        total = len(text)
-        return {key: count / total for key, count in counts.items()}
-
-    def _classify_character(self, char: str) -> str:
-        """Classify a character into one of the tracked categories."""
-        # Check ASCII first (most common in mixed text)
-        if char.isascii():
-            if char.isdigit():
-                return "digit"
-            if char.isalpha():
-                return "ascii"
-            return "symbol"
-
-        # Use Unicode name for Japanese character classification
-        try:
-            name = unicodedata.name(char, "")
-        except ValueError:
-            return "symbol"
-
-        if "CJK UNIFIED IDEOGRAPH" in name or "CJK COMPATIBILITY IDEOGRAPH" in name:
-            return "kanji"
-        if "HIRAGANA" in name:
-            return "hiragana"
-        if "KATAKANA" in name:
-            return "katakana"
-        if char.isdigit():
-            return "digit"
-
-        return "symbol"
+        return {key: counts[key] / total for key in _CHARACTER_CLASSES}
 
     def _has_meta_discussion(self, text: str) -> bool:
         """Check if line contains meta-discussion markers."""
-        return any(pattern.search(text) for pattern in _META_DISCUSSION_PATTERNS)
+        return _META_DISCUSSION_RE.search(text) is not None
 
     def _is_inside_quotation_marks(self, text: str) -> bool:
         """Check if line content appears to be inside quotation marks.
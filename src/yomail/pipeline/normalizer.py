@@ -5,13 +5,49 @@ Handles:
 - Japanese text normalization (neologdn + NFKC)
 """
 
+import re
 import unicodedata
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 
 import neologdn
 
 from yomail.exceptions import InvalidInputError
 
+# CRLF or bare CR, folded to LF in one pass
+_LINE_ENDING_PATTERN = re.compile(r"\r\n?")
+
+# Zero-width characters to strip (invisible noise)
+_ZERO_WIDTH_CHARS = "\ufeff\u200b\u200c\u200d\u2060"
+
+# Translation table deleting all zero-width characters in one pass
+_ZERO_WIDTH_TABLE = str.maketrans("", "", _ZERO_WIDTH_CHARS)
+
+# Lines up to this length go through the cache; longer ones are rarely repeated
+_CACHED_LINE_MAX_LENGTH = 128
+
+
+def _normalize_content_line(line: str) -> str:
+    """Apply neologdn, NFKC and zero-width stripping to a single line."""
+    normalized = neologdn.normalize(line)
+    # NFKC is the identity on ASCII, and zero-width characters are non-ASCII
+    if normalized.isascii():
+        return normalized
+    normalized = unicodedata.normalize("NFKC", normalized)
+    return normalized.translate(_ZERO_WIDTH_TABLE)
+
+
+@lru_cache(maxsize=2048)
+def _normalize_short_content_line(line: str) -> str:
+    """Cached _normalize_content_line for lines up to _CACHED_LINE_MAX_LENGTH.
+
+    Short lines (greetings, closings, signature blocks) recur across emails
+    and the result depends only on the line text. Long lines bypass the
+    cache so it never holds arbitrarily large input.
+    """
+    return _normalize_content_line(line)
+
 
 @dataclass(frozen=True, slots=True)
 class NormalizedEmail:
@@ -48,37 +84,47 @@ class Normalizer:
             InvalidInputError: If text is empty after normalization.
         """
         # Normalize line endings: CRLF and CR to LF
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
-
-        # Apply Japanese text normalization
-        text = self._normalize_japanese(text)
+        text = _LINE_ENDING_PATTERN.sub("\n", text)
 
-        # Split into lines and strip whitespace from each
-        lines = [line.strip() for line in text.split("\n")]
+        # Apply Japanese text normalization line by line and strip whitespace from each
+        lines = [self._normalize_japanese(line).strip() for line in text.split("\n")]
 
-        # Remove leading blank lines
-        while lines and not lines[0]:
-            lines.pop(0)
-
-        # Remove trailing blank lines
-        while lines and not lines[-1]:
-            lines.pop()
+        # Remove leading and trailing blank lines
+        content_indices = [idx for idx, line in enumerate(lines) if line]
 
         # Check for empty result
-        if not lines:
+        if not content_indices:
             raise InvalidInputError(message="Empty input after normalization")
 
+        lines = lines[content_indices[0] : content_indices[-1] + 1]
+
         return NormalizedEmail(
             lines=tuple(lines),
             text="\n".join(lines),
         )
 
+    def normalize_batch(self, texts: Iterable[str]) -> list[NormalizedEmail]:
+        """Normalize many email texts.
+
+        Equivalent to calling normalize() on each text in order. Short
+        lines recurring across the batch are normalized once via the
+        shared per-line cache.
+
+        Args:
+            texts: Raw email texts (UTF-8 strings).
+
+        Returns:
+            One NormalizedEmail per input text, in input order.
+
+        Raises:
+            InvalidInputError: If any text is empty after normalization.
+        """
+        normalize = self.normalize
+        return [normalize(text) for text in texts]
+
     # Dash-like characters for unification
     _DASH_CHARS = frozenset("-ー")
 
-    # Zero-width characters to strip (invisible noise)
-    _ZERO_WIDTH_CHARS = "\ufeff\u200b\u200c\u200d\u2060"
-
     # CHOONPUS from neologdn - these get collapsed (ーーー→ー)
     _CHOONPUS = frozenset("﹣－ｰ—―─━ー")
 
@@ -91,6 +137,9 @@ class Normalizer:
         "="  # equals (often mixed with dashes)
     )
 
+    # Delimiter line rewrite in one pass: drop zero-width chars, CHOONPUS → '-'
+    _DELIMITER_LINE_TABLE = str.maketrans({**dict.fromkeys(_ZERO_WIDTH_CHARS), **dict.fromkeys(_CHOONPUS, "-")})
+
     def _is_delimiter_line(self, line: str) -> bool:
         """Check if line consists only of delimiter characters.
 
@@ -98,33 +147,22 @@ class Normalizer:
         Includes dashes, decorative shapes, and brackets.
         """
         # Strip zero-width chars first (they shouldn't affect detection)
-        for ch in self._ZERO_WIDTH_CHARS:
-            line = line.replace(ch, "")
-        stripped = line.strip()
+        stripped = line.translate(_ZERO_WIDTH_TABLE).strip()
         if not stripped:
             return False
-        return all(c in self._DELIMITER_CHARS for c in stripped)
+        return self._DELIMITER_CHARS.issuperset(stripped)
 
     def _normalize_delimiter_line(self, line: str) -> str:
         """Normalize a delimiter line.
 
         Converts CHOONPU chars to '-', preserves other delimiter chars.
-        Strips whitespace and zero-width characters.
+        Strips whitespace and zero-width characters. Only called on lines
+        that pass _is_delimiter_line, so no other characters are present.
         """
-        # Strip zero-width chars first
-        for ch in self._ZERO_WIDTH_CHARS:
-            line = line.replace(ch, "")
-        # Convert CHOONPUS to hyphen, keep other delimiter chars
-        result = []
-        for c in line:
-            if c in self._CHOONPUS:
-                result.append("-")
-            elif c in self._DELIMITER_CHARS or c.isspace():
-                result.append(c)
-        return "".join(result).strip()
-
-    def _normalize_japanese(self, text: str) -> str:
-        """Apply Japanese-specific normalization.
+        return line.translate(self._DELIMITER_LINE_TABLE).strip()
+
+    def _normalize_japanese(self, line: str) -> str:
+        """Apply Japanese-specific normalization to a single line.
 
         Uses neologdn followed by NFKC normalization.
         Lines containing only CHOONPU characters skip neologdn
@@ -138,53 +176,35 @@ class Normalizer:
 
         NFKC handles remaining Unicode compatibility decomposition.
         """
-        # Process line by line to protect delimiter lines from CHOONPU collapsing
-        lines = text.split("\n")
-        normalized_lines = []
-
-        for line in lines:
-            if self._is_delimiter_line(line):
-                # Skip neologdn, normalize delimiter chars directly
-                normalized_lines.append(self._normalize_delimiter_line(line))
-            else:
-                # Full normalization
-                normalized = neologdn.normalize(line)
-                normalized = unicodedata.normalize("NFKC", normalized)
-                # Strip zero-width characters
-                for ch in self._ZERO_WIDTH_CHARS:
-                    normalized = normalized.replace(ch, "")
-                normalized_lines.append(normalized)
-
-        text = "\n".join(normalized_lines)
+        # Protect delimiter lines from CHOONPU collapsing
+        if self._is_delimiter_line(line):
+            # Skip neologdn, normalize delimiter chars directly
+            line = self._normalize_delimiter_line(line)
+        elif len(line) <= _CACHED_LINE_MAX_LENGTH:
+            # Full normalization, cached for short recurring lines
+            line = _normalize_short_content_line(line)
+        else:
+            # Full normalization
+            line = _normalize_content_line(line)
 
         # Unify dashes in delimiter-only lines (for mixed dash lines that went through neologdn)
-        text = self._unify_delimiter_lines(text)
-
-        return text
+        return self._unify_delimiter_line(line)
 
-    def _unify_delimiter_lines(self, text: str) -> str:
-        """Unify dash characters in lines that contain only dashes.
+    def _unify_delimiter_line(self, line: str) -> str:
+        """Unify dash characters in a line that contains only dashes.
 
         For lines consisting entirely of dash-like characters (- and ー),
         normalize all dashes to the majority character in that line.
         This preserves visual appearance while ensuring consistency.
         """
-        lines = text.split("\n")
-        result = []
-
-        for line in lines:
-            stripped = line.strip()
-            if stripped and all(ch in self._DASH_CHARS for ch in stripped):
-                # Line is all dashes - unify to majority
-                count_hyphen = stripped.count("-")
-                count_prolonged = stripped.count("ー")
-                target = "-" if count_hyphen >= count_prolonged else "ー"
-                # Preserve leading/trailing whitespace
-                leading = line[: len(line) - len(line.lstrip())]
-                trailing = line[len(line.rstrip()) :]
-                unified = target * len(stripped)
-                result.append(leading + unified + trailing)
-            else:
-                result.append(line)
-
-        return "\n".join(result)
+        stripped = line.strip()
+        if not stripped or not self._DASH_CHARS.issuperset(stripped):
+            return line
+
+        # Line is all dashes - unify to majority; everything that isn't '-' is 'ー'
+        count_hyphen = stripped.count("-")
+        target = "-" if 2 * count_hyphen >= len(stripped) else "ー"
+        # Preserve leading/trailing whitespace
+        leading = line[: len(line) - len(line.lstrip())]
+        trailing = line[len(line.rstrip()) :]
+        return leading + target * len(stripped) + trailing
@@ -12,6 +12,7 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from yomail.patterns._combine import combine_patterns
 from yomail.patterns.separators import is_separator_line
 
 if TYPE_CHECKING:
@@ -86,6 +87,7 @@ _FORWARD_REPLY_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"^件名:\s+.+$"),
 )
 
+_FORWARD_REPLY_RE = combine_patterns(_FORWARD_REPLY_PATTERNS)
 
 
 class StructuralAnalyzer:
@@ -199,4 +201,4 @@ class StructuralAnalyzer:
         if not stripped:
             return False
 
-        return any(pattern.match(stripped) for pattern in _FORWARD_REPLY_PATTERNS)
+        return _FORWARD_REPLY_RE.match(stripped) is not None
@@ -0,0 +1,33 @@
+"""Pipeline components and helpers shared across test modules."""
+
+from functools import lru_cache
+
+from yomail.pipeline.content_filter import ContentFilter
+from yomail.pipeline.features import ExtractedFeatures, FeatureExtractor
+from yomail.pipeline.normalizer import Normalizer
+from yomail.pipeline.reconstructor import Reconstructor
+from yomail.pipeline.structural import StructuralAnalyzer
+
+# Pipeline components are stateless, so one instance of each serves every test
+NORMALIZER = Normalizer()
+CONTENT_FILTER = ContentFilter()
+ANALYZER = StructuralAnalyzer()
+EXTRACTOR = FeatureExtractor()
+RECONSTRUCTOR = Reconstructor()
+
+
+@lru_cache(maxsize=None)
+def extract_features(text: str) -> tuple[ExtractedFeatures, tuple[str, ...]]:
+    """Run the full pipeline up to feature extraction.
+
+    Results are immutable, so repeated inputs share one cached result.
+
+    Returns:
+        Tuple of (features, content line texts), as taken by CRFTrainer and CRFSequenceLabeler.
+    """
+    normalized = NORMALIZER.normalize(text)
+    filtered = CONTENT_FILTER.filter(normalized)
+    analysis = ANALYZER.analyze(filtered)
+    features = EXTRACTOR.extract(analysis, filtered)
+    content_texts = tuple(line.text for line in filtered.content_lines)
+    return features, content_texts
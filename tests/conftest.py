@@ -0,0 +1,116 @@
+"""Shared pytest fixtures."""
+
+import hashlib
+import os
+from importlib.metadata import version
+from pathlib import Path
+
+import pytest
+
+import yomail.pipeline.crf
+import yomail.pipeline.features
+from tests._pipeline import extract_features
+from yomail import __version__
+from yomail.pipeline.crf import CRFTrainer, Label
+
+# Training data: (text, content_labels), covering every label type.
+# Labels are for content lines only (blank lines are filtered out)
+_TRAIN_EXAMPLES: tuple[tuple[str, tuple[Label, ...]], ...] = (
+    # Greeting + Body + Closing
+    (
+        "お世話になっております。\n本日は会議の件でご連絡いたします。\nよろしくお願いいたします。",
+        ("GREETING", "BODY", "CLOSING"),
+    ),
+    # Body only
+    (
+        "明日の予定を確認しました。\n問題ありません。",
+        ("BODY", "BODY"),
+    ),
+    # With signature
+    (
+        "ご確認ください。\n---\n田中太郎\nTEL: 03-1234-5678",
+        ("BODY", "OTHER", "SIGNATURE", "SIGNATURE"),
+    ),
+    # With quote
+    (
+        "> 前回のメール\n承知しました。",
+        ("QUOTE", "BODY"),
+    ),
+    # Multiple body lines
+    (
+        "情報です。\n続きです。\n以上",
+        ("BODY", "BODY", "CLOSING"),
+    ),
+)
+
+# Tests only check the shape of predictions, not their quality, so a few
+# L-BFGS iterations over five short sequences are enough.
+_TRAIN_MAX_ITERATIONS = 10
+
+# Trainer inputs are computed once at import and reused for every training run
+_PREPARED = tuple((*extract_features(text), labels) for text, labels in _TRAIN_EXAMPLES)
+
+
+def _test_model_key() -> str:
+    """Cache key for the on-disk test model.
+
+    Changes whenever the training examples, trainer settings, crfsuite
+    version, or the feature extraction and CRF source (which define the
+    feature names fed to crfsuite) do.
+    """
+    digest = hashlib.sha256(
+        repr((__version__, version("python-crfsuite"), _TRAIN_MAX_ITERATIONS, _TRAIN_EXAMPLES)).encode()
+    )
+    for module in (yomail.pipeline.features, yomail.pipeline.crf):
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _train_test_model(model_path: Path) -> None:
+    """Train a minimal model for testing.
+
+    This is intentionally minimal - just enough to test the inference code.
+    """
+    trainer = CRFTrainer(max_iterations=_TRAIN_MAX_ITERATIONS)
+    for features, content_texts, labels in _PREPARED:
+        trainer.add_sequence(features, content_texts, labels)
+    trainer.train(model_path)
+
+
+def _test_model_filename() -> str:
+    """File name of the cached test model for the current training inputs."""
+    return f"crf_{_test_model_key()}.crfsuite"
+
+
+def _test_cache_dir() -> Path:
+    """Per-user cache directory for test artifacts (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "yomail_tests"
+
+
+@pytest.fixture(scope="session")
+def trained_model_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Path to the minimal test model, trained once per session.
+
+    Set YOMAIL_TEST_MODEL_CACHE=1 to keep the model in the user cache
+    directory instead, so later pytest runs skip training until its inputs
+    change.
+    """
+    if os.environ.get("YOMAIL_TEST_MODEL_CACHE") != "1":
+        model_path = tmp_path_factory.mktemp("model") / "test.crfsuite"
+        _train_test_model(model_path)
+        return model_path
+
+    cache_path = _test_cache_dir() / _test_model_filename()
+    if not cache_path.exists():
+        # Train next to the final path and rename, so concurrent runs never see a partial file
+        partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        _train_test_model(partial_path)
+        os.replace(partial_path, cache_path)
+    return cache_path
+
+
+@pytest.fixture(scope="session")
+def trained_model_bytes(trained_model_path: Path) -> bytes:
+    """Contents of the session test model, for loading without touching disk."""
+    return trained_model_path.read_bytes()
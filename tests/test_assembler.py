@@ -210,12 +210,12 @@ class TestBlankLineHandling:
 
     def test_blank_lines_between_body_included(self) -> None:
         """Blank lines between body content are included in output."""
-        lines = [
+        lines = (
             _make_reconstructed_line("Para 1", "BODY", 0),
             _make_reconstructed_line("", "BODY", 1, is_blank=True),  # inherits BODY
             _make_reconstructed_line("Para 2", "BODY", 2),
-        ]
-        doc = ReconstructedDocument(lines=tuple(lines), sequence_probability=0.9)
+        )
+        doc = ReconstructedDocument(lines=lines, sequence_probability=0.9)
         assembler = BodyAssembler()
         assembled = assembler.assemble(doc)
 
@@ -225,12 +225,12 @@ class TestBlankLineHandling:
 
     def test_trailing_blank_lines_excluded(self) -> None:
         """Blank lines at the end of body are excluded."""
-        lines = [
+        lines = (
             _make_reconstructed_line("Content", "BODY", 0),
             _make_reconstructed_line("", "BODY", 1, is_blank=True),
             _make_reconstructed_line("", "BODY", 2, is_blank=True),
-        ]
-        doc = ReconstructedDocument(lines=tuple(lines), sequence_probability=0.9)
+        )
+        doc = ReconstructedDocument(lines=lines, sequence_probability=0.9)
         assembler = BodyAssembler()
         assembled = assembler.assemble(doc)
 
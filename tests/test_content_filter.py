@@ -1,5 +1,7 @@
 """Tests for ContentFilter component."""
 
+import pytest
+
 from yomail.pipeline.content_filter import ContentFilter, ContentLine
 from yomail.pipeline.normalizer import NormalizedEmail
 
@@ -159,8 +161,5 @@ class TestContentLine:
             blank_lines_before=1,
             blank_lines_after=2,
         )
-        try:
+        with pytest.raises(AttributeError):
             line.text = "Changed"  # type: ignore[misc]
-            assert False, "Should not allow mutation"
-        except AttributeError:
-            pass  # Expected
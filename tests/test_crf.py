@@ -1,119 +1,67 @@
-"""Tests for the CRF Sequence Labeler component (inference only)."""
+"""Tests for the CRF Sequence Labeler and CRF Trainer components."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
+from tests._pipeline import extract_features
 from yomail.pipeline.crf import (
     LABELS,
     CRFSequenceLabeler,
     CRFTrainer,
-    Label,
     LabeledLine,
     SequenceLabelingResult,
     _features_to_dict,
 )
-from yomail.pipeline.content_filter import ContentFilter
-from yomail.pipeline.features import ExtractedFeatures, FeatureExtractor, LineFeatures
-from yomail.pipeline.normalizer import Normalizer
-from yomail.pipeline.structural import StructuralAnalyzer
-
-
-def _make_line_features(
-    position_normalized: float = 0.5,
-    position_reverse: float = 0.5,
-    lines_from_start: int = 5,
-    lines_from_end: int = 5,
-    position_rel_first_quote: float = 0.0,
-    position_rel_last_quote: float = 0.0,
-    line_length: int = 20,
-    kanji_ratio: float = 0.3,
-    hiragana_ratio: float = 0.3,
-    katakana_ratio: float = 0.1,
-    ascii_ratio: float = 0.2,
-    digit_ratio: float = 0.05,
-    symbol_ratio: float = 0.05,
-    leading_whitespace: int = 0,
-    trailing_whitespace: int = 0,
-    blank_lines_before: int = 0,
-    blank_lines_after: int = 0,
-    quote_depth: int = 0,
-    is_forward_reply_header: bool = False,
-    preceded_by_delimiter: bool = False,
-    is_delimiter: bool = False,
-    is_greeting: bool = False,
-    is_closing: bool = False,
-    has_contact_info: bool = False,
-    has_company_pattern: bool = False,
-    has_position_pattern: bool = False,
-    has_name_pattern: bool = False,
-    is_visual_separator: bool = False,
-    has_meta_discussion: bool = False,
-    is_inside_quotation_marks: bool = False,
-    context_greeting_count: int = 0,
-    context_closing_count: int = 0,
-    context_contact_count: int = 0,
-    context_quote_count: int = 0,
-    context_separator_count: int = 0,
-    in_bracketed_section: bool = False,
-    bracket_has_signature_patterns: bool = False,
-) -> LineFeatures:
+from yomail.pipeline.features import ExtractedFeatures, LineFeatures
+
+# Default field values for _make_line_features; tests override only what they need.
+_LINE_FEATURES_DEFAULTS: dict[str, float | int | bool] = {
+    "position_normalized": 0.5,
+    "position_reverse": 0.5,
+    "lines_from_start": 5,
+    "lines_from_end": 5,
+    "position_rel_first_quote": 0.0,
+    "position_rel_last_quote": 0.0,
+    "line_length": 20,
+    "kanji_ratio": 0.3,
+    "hiragana_ratio": 0.3,
+    "katakana_ratio": 0.1,
+    "ascii_ratio": 0.2,
+    "digit_ratio": 0.05,
+    "symbol_ratio": 0.05,
+    "leading_whitespace": 0,
+    "trailing_whitespace": 0,
+    "blank_lines_before": 0,
+    "blank_lines_after": 0,
+    "quote_depth": 0,
+    "is_forward_reply_header": False,
+    "preceded_by_delimiter": False,
+    "is_delimiter": False,
+    "is_greeting": False,
+    "is_closing": False,
+    "has_contact_info": False,
+    "has_company_pattern": False,
+    "has_position_pattern": False,
+    "has_name_pattern": False,
+    "is_visual_separator": False,
+    "has_meta_discussion": False,
+    "is_inside_quotation_marks": False,
+    "context_greeting_count": 0,
+    "context_closing_count": 0,
+    "context_contact_count": 0,
+    "context_quote_count": 0,
+    "context_separator_count": 0,
+    "in_bracketed_section": False,
+    "bracket_has_signature_patterns": False,
+}
+
+_LABELS_SET = frozenset(LABELS)
+
+
+def _make_line_features(**overrides: float | int | bool) -> LineFeatures:
     """Create a LineFeatures with sensible defaults."""
-    return LineFeatures(
-        position_normalized=position_normalized,
-        position_reverse=position_reverse,
-        lines_from_start=lines_from_start,
-        lines_from_end=lines_from_end,
-        position_rel_first_quote=position_rel_first_quote,
-        position_rel_last_quote=position_rel_last_quote,
-        line_length=line_length,
-        kanji_ratio=kanji_ratio,
-        hiragana_ratio=hiragana_ratio,
-        katakana_ratio=katakana_ratio,
-        ascii_ratio=ascii_ratio,
-        digit_ratio=digit_ratio,
-        symbol_ratio=symbol_ratio,
-        leading_whitespace=leading_whitespace,
-        trailing_whitespace=trailing_whitespace,
-        blank_lines_before=blank_lines_before,
-        blank_lines_after=blank_lines_after,
-        quote_depth=quote_depth,
-        is_forward_reply_header=is_forward_reply_header,
-        preceded_by_delimiter=preceded_by_delimiter,
-        is_delimiter=is_delimiter,
-        is_greeting=is_greeting,
-        is_closing=is_closing,
-        has_contact_info=has_contact_info,
-        has_company_pattern=has_company_pattern,
-        has_position_pattern=has_position_pattern,
-        has_name_pattern=has_name_pattern,
-        is_visual_separator=is_visual_separator,
-        has_meta_discussion=has_meta_discussion,
-        is_inside_quotation_marks=is_inside_quotation_marks,
-        context_greeting_count=context_greeting_count,
-        context_closing_count=context_closing_count,
-        context_contact_count=context_contact_count,
-        context_quote_count=context_quote_count,
-        context_separator_count=context_separator_count,
-        in_bracketed_section=in_bracketed_section,
-        bracket_has_signature_patterns=bracket_has_signature_patterns,
-    )
-
-
-def _extract_features(text: str) -> tuple[ExtractedFeatures, tuple[str, ...]]:
-    """Run the full pipeline up to feature extraction."""
-    normalizer = Normalizer()
-    content_filter = ContentFilter()
-    analyzer = StructuralAnalyzer()
-    extractor = FeatureExtractor()
-
-    normalized = normalizer.normalize(text)
-    filtered = content_filter.filter(normalized)
-    analysis = analyzer.analyze(filtered)
-    features = extractor.extract(analysis, filtered)
-    content_texts = tuple(line.text for line in filtered.content_lines)
-    return features, content_texts
+    return LineFeatures(**{**_LINE_FEATURES_DEFAULTS, **overrides})  # type: ignore[arg-type]
 
 
 class TestFeatureConversion:
@@ -210,19 +158,40 @@ class TestCRFSequenceLabeler:
         with pytest.raises(FileNotFoundError):
             labeler.load_model("/nonexistent/model.crfsuite")
 
-    def test_empty_input_returns_empty(self) -> None:
+    def test_empty_input_returns_empty(self, trained_model_path: Path) -> None:
         """Empty input returns empty result."""
-        # Create a minimal model to test with
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_minimal_model(model_path)
+        labeler = CRFSequenceLabeler(trained_model_path)
+        features = ExtractedFeatures(line_features=(), total_lines=0)
+        result = labeler.predict(features, ())
+
+        assert result.labeled_lines == ()
+        assert result.sequence_probability == 1.0
+
+    def test_load_model_bytes(self, trained_model_bytes: bytes) -> None:
+        """A model can be loaded from memory."""
+        labeler = CRFSequenceLabeler(use_default=False)
+        labeler.load_model_bytes(trained_model_bytes)
+
+        assert labeler.is_loaded is True
+        assert set(labeler.labels) <= _LABELS_SET
+
+    def test_unload_model(self, trained_model_path: Path) -> None:
+        """unload_model() closes the tagger; calling it again is a no-op."""
+        labeler = CRFSequenceLabeler(trained_model_path)
+        labeler.unload_model()
 
-            labeler = CRFSequenceLabeler(model_path)
-            features = ExtractedFeatures(line_features=(), total_lines=0)
-            result = labeler.predict(features, ())
+        assert labeler.is_loaded is False
+        labeler.unload_model()
+        assert labeler.is_loaded is False
 
-            assert result.labeled_lines == ()
-            assert result.sequence_probability == 1.0
+    def test_invalid_model_bytes_raises(self) -> None:
+        """Loading garbage bytes raises RuntimeError."""
+        labeler = CRFSequenceLabeler(use_default=False)
+
+        with pytest.raises(RuntimeError, match="Failed to load CRF model"):
+            # Long enough that crfsuite reads a full header before rejecting the magic
+            labeler.load_model_bytes(b"not a model" * 16)
+        assert labeler.is_loaded is False
 
     def test_labels_property_default(self) -> None:
         """Labels property returns expected labels when no model loaded."""
@@ -238,101 +207,73 @@ class TestCRFSequenceLabeler:
 class TestIntegrationWithModel:
     """Integration tests with a trained model."""
 
-    def test_predict_returns_labeled_lines(self) -> None:
+    def test_predict_returns_labeled_lines(self, trained_model_path: Path) -> None:
         """Prediction returns LabeledLine objects."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_minimal_model(model_path)
-
-            labeler = CRFSequenceLabeler(model_path)
+        labeler = CRFSequenceLabeler(trained_model_path)
 
-            text = "お世話になっております。\n本日の件についてご連絡いたします。\nよろしくお願いいたします。"
-            features, texts = _extract_features(text)
-            result = labeler.predict(features, texts)
+        text = "お世話になっております。\n本日の件についてご連絡いたします。\nよろしくお願いいたします。"
+        features, texts = extract_features(text)
+        result = labeler.predict(features, texts)
 
-            assert isinstance(result, SequenceLabelingResult)
-            assert len(result.labeled_lines) == 3
+        assert isinstance(result, SequenceLabelingResult)
+        assert len(result.labeled_lines) == 3
 
-            for line in result.labeled_lines:
-                assert isinstance(line, LabeledLine)
-                assert line.label in LABELS
-                assert 0.0 <= line.confidence <= 1.0
-                assert isinstance(line.label_probabilities, dict)
+        for line in result.labeled_lines:
+            assert isinstance(line, LabeledLine)
+            assert line.label in _LABELS_SET
+            assert 0.0 <= line.confidence <= 1.0
+            assert isinstance(line.label_probabilities, dict)
 
-    def test_predict_sequence_probability(self) -> None:
+    def test_predict_sequence_probability(self, trained_model_path: Path) -> None:
         """Sequence probability is between 0 and 1."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_minimal_model(model_path)
-
-            labeler = CRFSequenceLabeler(model_path)
+        labeler = CRFSequenceLabeler(trained_model_path)
 
-            text = "テスト\nメール"
-            features, texts = _extract_features(text)
-            result = labeler.predict(features, texts)
+        text = "テスト\nメール"
+        features, texts = extract_features(text)
+        result = labeler.predict(features, texts)
 
-            assert 0.0 <= result.sequence_probability <= 1.0
+        assert 0.0 <= result.sequence_probability <= 1.0
 
-    def test_label_probabilities_sum_roughly_to_one(self) -> None:
+    def test_label_probabilities_sum_roughly_to_one(self, trained_model_path: Path) -> None:
         """Label probabilities for each position sum to approximately 1."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_minimal_model(model_path)
-
-            labeler = CRFSequenceLabeler(model_path)
-
-            text = "お世話になっております。"
-            features, texts = _extract_features(text)
-            result = labeler.predict(features, texts)
-
-            for line in result.labeled_lines:
-                total_prob = sum(line.label_probabilities.values())
-                # Allow some floating point tolerance
-                assert 0.99 <= total_prob <= 1.01
-
-
-def _train_minimal_model(model_path: Path) -> None:
-    """Train a minimal model for testing.
-
-    Creates a simple model trained on a few examples covering all labels.
-    This is intentionally minimal - just enough to test the inference code.
-    """
-    trainer = CRFTrainer(max_iterations=50)
-
-    # Training examples covering different label types
-    examples: list[tuple[str, tuple[Label, ...]]] = [
-        # Greeting + Body + Closing
-        (
-            "お世話になっております。\n本日は会議の件でご連絡いたします。\nよろしくお願いいたします。",
-            ("GREETING", "BODY", "CLOSING"),
-        ),
-        # Body only
-        (
-            "明日の予定を確認しました。\n問題ありません。",
-            ("BODY", "BODY"),
-        ),
-        # With signature
-        (
-            "ご確認ください。\n---\n田中太郎\nTEL: 03-1234-5678",
-            ("BODY", "OTHER", "SIGNATURE", "SIGNATURE"),
-        ),
-        # With quote
-        (
-            "> 前回のメール\n承知しました。",
-            ("QUOTE", "BODY"),
-        ),
-        # Multiple body lines (blank lines are filtered out before labeling)
-        (
-            "情報です。\n続きです。\n以上",
-            ("BODY", "BODY", "CLOSING"),
-        ),
-    ]
-
-    for text, labels in examples:
-        features, texts = _extract_features(text)
-        trainer.add_sequence(features, texts, labels)
-
-    trainer.train(model_path)
+        labeler = CRFSequenceLabeler(trained_model_path)
+
+        text = "お世話になっております。"
+        features, texts = extract_features(text)
+        result = labeler.predict(features, texts)
+
+        for line in result.labeled_lines:
+            total_prob = sum(line.label_probabilities.values())
+            # Allow some floating point tolerance
+            assert 0.99 <= total_prob <= 1.01
+
+
+class TestCRFTrainer:
+    """Tests for training a model with CRFTrainer."""
+
+    def test_train_writes_loadable_model(self, tmp_path: Path) -> None:
+        """Sequences added to the trainer produce a model the labeler can load."""
+        trainer = CRFTrainer(max_iterations=5)
+        for text, labels in (
+            ("お世話になっております。\n会議の件です。", ("GREETING", "BODY")),
+            ("承知しました。\nよろしくお願いいたします。", ("BODY", "CLOSING")),
+        ):
+            features, texts = extract_features(text)
+            trainer.add_sequence(features, texts, labels)
+
+        model_path = tmp_path / "model" / "test.crfsuite"
+        trainer.train(model_path)
+
+        labeler = CRFSequenceLabeler(model_path)
+        assert set(labeler.labels) == {"GREETING", "BODY", "CLOSING"}
+
+    def test_add_sequence_label_count_mismatch_raises(self) -> None:
+        """A label count that differs from the line count is rejected."""
+        trainer = CRFTrainer()
+        features, texts = extract_features("一行目\n二行目")
+
+        with pytest.raises(ValueError, match="Number of labels"):
+            trainer.add_sequence(features, texts, ("BODY",))
 
 
 class TestUnifyBracketedBlocks:
@@ -341,17 +282,15 @@ class TestUnifyBracketedBlocks:
     def _make_extracted_features(
         self, separator_positions: list[int], total: int
     ) -> ExtractedFeatures:
-        """Create ExtractedFeatures with separators at specified positions."""
-        features = []
-        for i in range(total):
-            is_sep = i in separator_positions
-            features.append(
-                _make_line_features(
-                    is_visual_separator=is_sep,
-                    is_delimiter=False,
-                )
-            )
-        return ExtractedFeatures(line_features=tuple(features), total_lines=total)
+        """Create ExtractedFeatures with separators at specified positions.
+
+        Lines differ only in is_visual_separator, so every position reuses one
+        of two shared (frozen) LineFeatures instances.
+        """
+        plain = _make_line_features(is_visual_separator=False, is_delimiter=False)
+        separator = _make_line_features(is_visual_separator=True, is_delimiter=False)
+        features = tuple(separator if i in separator_positions else plain for i in range(total))
+        return ExtractedFeatures(line_features=features, total_lines=total)
 
     def test_majority_body_unifies_to_body(self) -> None:
         """Block with majority BODY labels unifies to BODY."""
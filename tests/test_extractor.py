@@ -1,6 +1,6 @@
 """Tests for the EmailBodyExtractor class."""
 
-import tempfile
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 import pytest
@@ -10,55 +10,26 @@ from yomail import (
     ExtractionResult,
     InvalidInputError,
 )
-from yomail.pipeline.content_filter import ContentFilter
-from yomail.pipeline.crf import CRFTrainer, Label
-from yomail.pipeline.features import FeatureExtractor
-from yomail.pipeline.normalizer import Normalizer
-from yomail.pipeline.structural import StructuralAnalyzer
-
-
-def _train_test_model(model_path: Path) -> None:
-    """Train a minimal model for testing."""
-    normalizer = Normalizer()
-    content_filter = ContentFilter()
-    analyzer = StructuralAnalyzer()
-    extractor = FeatureExtractor()
-    trainer = CRFTrainer(max_iterations=50)
-
-    # Training data: (text, content_labels)
-    # Labels are for content lines only (blank lines are filtered out)
-    examples: list[tuple[str, tuple[Label, ...]]] = [
-        (
-            "お世話になっております。\n本日は会議の件でご連絡いたします。\nよろしくお願いいたします。",
-            ("GREETING", "BODY", "CLOSING"),
-        ),
-        (
-            "明日の予定を確認しました。\n問題ありません。",
-            ("BODY", "BODY"),
-        ),
-        (
-            "ご確認ください。\n---\n田中太郎\nTEL: 03-1234-5678",
-            ("BODY", "OTHER", "SIGNATURE", "SIGNATURE"),
-        ),
-        (
-            "> 前回のメール\n承知しました。",
-            ("QUOTE", "BODY"),
-        ),
-        (
-            "情報です。\n続きです。\n以上",
-            ("BODY", "BODY", "CLOSING"),
-        ),
-    ]
-
-    for text, labels in examples:
-        normalized = normalizer.normalize(text)
-        filtered = content_filter.filter(normalized)
-        structural = analyzer.analyze(filtered)
-        features = extractor.extract(structural, filtered)
-        content_texts = tuple(line.text for line in filtered.content_lines)
-        trainer.add_sequence(features, content_texts, labels)
-
-    trainer.train(model_path)
+
+
+@pytest.fixture
+def make_extractor(trained_model_bytes: bytes) -> Iterator[Callable[..., EmailBodyExtractor]]:
+    """Factory for extractors running the in-memory test model.
+
+    Models are unloaded at teardown so long-lived workers don't accumulate taggers.
+    """
+    created: list[EmailBodyExtractor] = []
+
+    def _make(confidence_threshold: float = 0.5) -> EmailBodyExtractor:
+        extractor = EmailBodyExtractor(confidence_threshold=confidence_threshold, use_default=False)
+        extractor.load_model_bytes(trained_model_bytes)
+        created.append(extractor)
+        return extractor
+
+    yield _make
+
+    for extractor in created:
+        extractor.unload_model()
 
 
 class TestEmailBodyExtractor:
@@ -83,98 +54,100 @@ class TestEmailBodyExtractor:
         result = extractor.extract_safe("")
         assert result is None
 
-    def test_custom_model_path(self) -> None:
+    def test_custom_model_path(self, trained_model_path: Path) -> None:
         """Custom model path can be specified."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_test_model(model_path)
+        extractor = EmailBodyExtractor(model_path=trained_model_path)
+        assert extractor.is_model_loaded is True
 
-            extractor = EmailBodyExtractor(model_path=model_path)
-            assert extractor.is_model_loaded is True
+    def test_use_default_false_starts_unloaded(self) -> None:
+        """use_default=False skips loading the bundled model."""
+        extractor = EmailBodyExtractor(use_default=False)
+        assert extractor.is_model_loaded is False
+
+    def test_load_model_bytes(self, trained_model_bytes: bytes) -> None:
+        """A model loaded from memory replaces the bundled one."""
+        extractor = EmailBodyExtractor()
+        extractor.load_model_bytes(trained_model_bytes)
+        assert extractor.is_model_loaded is True
+
+    def test_unload_model(self) -> None:
+        """unload_model() leaves the extractor without a model."""
+        extractor = EmailBodyExtractor()
+        extractor.unload_model()
+
+        assert extractor.is_model_loaded is False
+        assert extractor.extract_safe("確認しました。") is None
 
 
 class TestExtractionResult:
     """Tests for ExtractionResult dataclass."""
 
-    def test_result_fields(self) -> None:
+    def test_result_fields(self, make_extractor: Callable[..., EmailBodyExtractor]) -> None:
         """ExtractionResult has expected fields."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_test_model(model_path)
+        extractor = make_extractor()
+        result = extractor.extract_with_metadata("テストメール")
 
-            extractor = EmailBodyExtractor(model_path=model_path)
-            result = extractor.extract_with_metadata("テストメール")
-
-            assert isinstance(result, ExtractionResult)
-            assert hasattr(result, "body")
-            assert hasattr(result, "confidence")
-            assert hasattr(result, "success")
-            assert hasattr(result, "error")
-            assert hasattr(result, "labeled_lines")
-            assert hasattr(result, "signature_detected")
-            assert hasattr(result, "inline_quotes_included")
+        assert isinstance(result, ExtractionResult)
+        assert hasattr(result, "body")
+        assert hasattr(result, "confidence")
+        assert hasattr(result, "success")
+        assert hasattr(result, "error")
+        assert hasattr(result, "labeled_lines")
+        assert hasattr(result, "signature_detected")
+        assert hasattr(result, "inline_quotes_included")
 
 
 class TestEndToEndExtraction:
     """End-to-end extraction tests."""
 
-    def test_simple_email_extraction(self) -> None:
+    def test_simple_email_extraction(self, make_extractor: Callable[..., EmailBodyExtractor]) -> None:
         """Simple email body is extracted."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_test_model(model_path)
-
-            extractor = EmailBodyExtractor(model_path=model_path)
+        extractor = make_extractor()
 
-            email = "お世話になっております。\n会議の件です。\nよろしくお願いいたします。"
-            result = extractor.extract_with_metadata(email)
+        email = "お世話になっております。\n会議の件です。\nよろしくお願いいたします。"
+        result = extractor.extract_with_metadata(email)
 
-            assert result.labeled_lines is not None
-            assert len(result.labeled_lines) == 3
-            assert 0.0 <= result.confidence <= 1.0
+        assert result.labeled_lines is not None
+        assert len(result.labeled_lines) == 3
+        assert 0.0 <= result.confidence <= 1.0
 
-    def test_email_with_signature(self) -> None:
+    def test_email_with_signature(self, make_extractor: Callable[..., EmailBodyExtractor]) -> None:
         """Email with signature detects signature."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_test_model(model_path)
+        extractor = make_extractor()
 
-            extractor = EmailBodyExtractor(model_path=model_path)
+        email = "ご確認ください。\n---\n山田太郎\nTEL: 03-1234-5678"
+        result = extractor.extract_with_metadata(email)
 
-            email = "ご確認ください。\n---\n山田太郎\nTEL: 03-1234-5678"
-            result = extractor.extract_with_metadata(email)
+        # Model should predict something
+        assert len(result.labeled_lines) == 4
 
-            # Model should predict something
-            assert len(result.labeled_lines) == 4
+    def test_extract_batch_matches_single(self, make_extractor: Callable[..., EmailBodyExtractor]) -> None:
+        """extract_batch() returns one result per email, same as extract_with_metadata()."""
+        extractor = make_extractor()
 
-    def test_extract_returns_string(self) -> None:
-        """extract() returns string body."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_test_model(model_path)
+        emails = ["お世話になっております。\n会議の件です。", "", "確認しました。"]
+        results = extractor.extract_batch(emails)
+
+        assert results == [extractor.extract_with_metadata(email) for email in emails]
 
-            # Use lower threshold for minimal test model (Viterbi scores are lower)
-            extractor = EmailBodyExtractor(
-                model_path=model_path, confidence_threshold=0.1
-            )
+    def test_extract_returns_string(self, make_extractor: Callable[..., EmailBodyExtractor]) -> None:
+        """extract() returns string body."""
+        # Use lower threshold for minimal test model (Viterbi scores are lower)
+        extractor = make_extractor(confidence_threshold=0.1)
 
-            email = "明日の予定を確認しました。\n問題ありません。"
-            body = extractor.extract(email)
+        email = "明日の予定を確認しました。\n問題ありません。"
+        body = extractor.extract(email)
 
-            assert isinstance(body, str)
-            assert len(body) > 0
+        assert isinstance(body, str)
+        assert len(body) > 0
 
-    def test_extract_safe_returns_string_on_success(self) -> None:
+    def test_extract_safe_returns_string_on_success(self, make_extractor: Callable[..., EmailBodyExtractor]) -> None:
         """extract_safe() returns string on success."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            model_path = Path(tmpdir) / "test.crfsuite"
-            _train_test_model(model_path)
-
-            extractor = EmailBodyExtractor(model_path=model_path)
+        extractor = make_extractor()
 
-            email = "確認しました。"
-            body = extractor.extract_safe(email)
+        email = "確認しました。"
+        body = extractor.extract_safe(email)
 
-            # May return None if confidence is low with minimal model
-            # Just verify it doesn't raise
-            assert body is None or isinstance(body, str)
+        # May return None if confidence is low with minimal model
+        # Just verify it doesn't raise
+        assert body is None or isinstance(body, str)
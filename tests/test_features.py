@@ -1,86 +1,85 @@
 """Tests for the FeatureExtractor component."""
 
-from yomail import FeatureExtractor, Normalizer, StructuralAnalyzer
-from yomail.pipeline.content_filter import ContentFilter
-from yomail.pipeline.features import _separators_match
-
+import pytest
 
-def _extract_features(text: str):
-    """Helper to run the full pipeline and extract features."""
-    normalizer = Normalizer()
-    content_filter = ContentFilter()
-    analyzer = StructuralAnalyzer()
-    extractor = FeatureExtractor()
+from tests._pipeline import ANALYZER, CONTENT_FILTER, EXTRACTOR, NORMALIZER, extract_features
+from yomail.pipeline.features import _separators_match
 
-    normalized = normalizer.normalize(text)
-    filtered = content_filter.filter(normalized)
-    analysis = analyzer.analyze(filtered)
-    return extractor.extract(analysis, filtered)
+# Exact-value expectations as (text, line index, feature name, expected).
+# Inputs repeat across rows, so each text runs through the pipeline once.
+_POSITIONAL_CASES: tuple[tuple[str, int, str, float | int], ...] = (
+    # Single line has position 0
+    ("Hello", 0, "position_normalized", 0.0),
+    # Position is normalized from 0 to 1
+    ("Line1\nLine2\nLine3", 0, "position_normalized", 0.0),
+    ("Line1\nLine2\nLine3", 1, "position_normalized", 0.5),
+    ("Line1\nLine2\nLine3", 2, "position_normalized", 1.0),
+    # Reverse position is 1 - normalized position
+    ("Line1\nLine2\nLine3", 0, "position_reverse", 1.0),
+    ("Line1\nLine2\nLine3", 1, "position_reverse", 0.5),
+    ("Line1\nLine2\nLine3", 2, "position_reverse", 0.0),
+    # Absolute line distances from start and end
+    ("A\nB\nC\nD", 0, "lines_from_start", 0),
+    ("A\nB\nC\nD", 0, "lines_from_end", 3),
+    ("A\nB\nC\nD", 3, "lines_from_start", 3),
+    ("A\nB\nC\nD", 3, "lines_from_end", 0),
+    # No quotes means zero relative position
+    ("No quotes here\nJust text", 0, "position_rel_first_quote", 0.0),
+    ("No quotes here\nJust text", 0, "position_rel_last_quote", 0.0),
+)
+
+_CONTENT_CASES: tuple[tuple[str, int, str, float | int], ...] = (
+    # Line length is character count
+    ("Hello", 0, "line_length", 5),
+    ("Text\n\nMore", 0, "line_length", 4),
+    ("Text\n\nMore", 1, "line_length", 4),
+    # Single-class lines have a ratio of 1.0 for that class
+    ("日本語", 0, "kanji_ratio", 1.0),
+    ("あいう", 0, "hiragana_ratio", 1.0),
+    ("アイウ", 0, "katakana_ratio", 1.0),
+    ("Hello", 0, "ascii_ratio", 1.0),
+    ("12345", 0, "digit_ratio", 1.0),
+    # ASCII-only lines split into letters, digits and symbols with no kana/kanji
+    ("AB1#", 0, "ascii_ratio", 0.5),
+    ("AB1#", 0, "digit_ratio", 0.25),
+    ("AB1#", 0, "symbol_ratio", 0.25),
+    ("AB1#", 0, "kanji_ratio", 0.0),
+)
 
 
 class TestPositionalFeatures:
     """Positional feature extraction tests."""
 
-    def test_position_normalized_single_line(self) -> None:
-        """Single line has position 0."""
-        result = _extract_features("Hello")
-
-        assert result.line_features[0].position_normalized == 0.0
-
-    def test_position_normalized_multiple_lines(self) -> None:
-        """Position is normalized from 0 to 1."""
-        result = _extract_features("Line1\nLine2\nLine3")
-
-        assert result.line_features[0].position_normalized == 0.0
-        assert result.line_features[1].position_normalized == 0.5
-        assert result.line_features[2].position_normalized == 1.0
-
-    def test_position_reverse(self) -> None:
-        """Reverse position is 1 - normalized position."""
-        result = _extract_features("Line1\nLine2\nLine3")
-
-        assert result.line_features[0].position_reverse == 1.0
-        assert result.line_features[1].position_reverse == 0.5
-        assert result.line_features[2].position_reverse == 0.0
-
-    def test_lines_from_start_end(self) -> None:
-        """Absolute line distances from start and end."""
-        result = _extract_features("A\nB\nC\nD")
+    @pytest.mark.parametrize(("text", "idx", "attr", "expected"), _POSITIONAL_CASES)
+    def test_positional_value(self, text: str, idx: int, attr: str, expected: float | int) -> None:
+        """Positional features take the expected exact values."""
+        result, _ = extract_features(text)
 
-        assert result.line_features[0].lines_from_start == 0
-        assert result.line_features[0].lines_from_end == 3
-        assert result.line_features[3].lines_from_start == 3
-        assert result.line_features[3].lines_from_end == 0
+        assert getattr(result.line_features[idx], attr) == expected
 
     def test_position_relative_to_quotes(self) -> None:
         """Position relative to quote blocks."""
         text = "Before\n> Quoted\nAfter"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # First quote is at index 1
         assert result.line_features[0].position_rel_first_quote < 0  # Before quote
         assert result.line_features[2].position_rel_first_quote > 0  # After quote
 
-    def test_no_quotes_zero_relative_position(self) -> None:
-        """No quotes means zero relative position."""
-        result = _extract_features("No quotes here\nJust text")
-
-        assert result.line_features[0].position_rel_first_quote == 0.0
-        assert result.line_features[0].position_rel_last_quote == 0.0
-
 
 class TestContentFeatures:
     """Content feature extraction tests."""
 
-    def test_line_length(self) -> None:
-        """Line length is character count."""
-        result = _extract_features("Hello")
+    @pytest.mark.parametrize(("text", "idx", "attr", "expected"), _CONTENT_CASES)
+    def test_content_value(self, text: str, idx: int, attr: str, expected: float | int) -> None:
+        """Content features take the expected exact values."""
+        result, _ = extract_features(text)
 
-        assert result.line_features[0].line_length == 5
+        assert getattr(result.line_features[idx], attr) == expected
 
     def test_blank_lines_tracked_as_context(self) -> None:
         """Blank lines are tracked via blank_lines_before/after."""
-        result = _extract_features("Text\n\nMore text")
+        result, _ = extract_features("Text\n\nMore text")
 
         # After filtering, we have 2 content lines
         assert len(result.line_features) == 2
@@ -91,7 +90,7 @@ class TestContentFeatures:
 
     def test_whitespace_only_filtered_out(self) -> None:
         """Whitespace-only lines are filtered out, tracked via context."""
-        result = _extract_features("Text\n   \nMore")
+        result, _ = extract_features("Text\n   \nMore")
 
         # Only 2 content lines after filtering
         assert len(result.line_features) == 2
@@ -100,45 +99,15 @@ class TestContentFeatures:
 
     def test_leading_trailing_whitespace(self) -> None:
         """Whitespace counts are non-negative."""
-        result = _extract_features("    Code block")
+        result, _ = extract_features("    Code block")
 
         features = result.line_features[0]
         assert features.leading_whitespace >= 0
         assert features.trailing_whitespace >= 0
 
-    def test_kanji_ratio(self) -> None:
-        """Kanji ratio is computed correctly."""
-        result = _extract_features("日本語")  # 3 kanji
-
-        assert result.line_features[0].kanji_ratio == 1.0
-
-    def test_hiragana_ratio(self) -> None:
-        """Hiragana ratio is computed correctly."""
-        result = _extract_features("あいう")  # 3 hiragana
-
-        assert result.line_features[0].hiragana_ratio == 1.0
-
-    def test_katakana_ratio(self) -> None:
-        """Katakana ratio is computed correctly."""
-        result = _extract_features("アイウ")  # 3 katakana
-
-        assert result.line_features[0].katakana_ratio == 1.0
-
-    def test_ascii_ratio(self) -> None:
-        """ASCII ratio is computed correctly."""
-        result = _extract_features("Hello")
-
-        assert result.line_features[0].ascii_ratio == 1.0
-
-    def test_digit_ratio(self) -> None:
-        """Digit ratio is computed correctly."""
-        result = _extract_features("12345")
-
-        assert result.line_features[0].digit_ratio == 1.0
-
     def test_mixed_character_ratios(self) -> None:
         """Mixed text has appropriate ratios."""
-        result = _extract_features("日本Hello")  # 2 kanji + 5 ASCII = 7 chars
+        result, _ = extract_features("日本Hello")  # 2 kanji + 5 ASCII = 7 chars
 
         features = result.line_features[0]
         assert 0.2 < features.kanji_ratio < 0.4  # ~28%
@@ -146,13 +115,10 @@ class TestContentFeatures:
 
     def test_content_lines_only_no_empty(self) -> None:
         """Empty lines are filtered out, only content lines remain."""
-        result = _extract_features("Text\n\nMore")
+        result, _ = extract_features("Text\n\nMore")
 
         # After filtering, only 2 content lines remain
         assert len(result.line_features) == 2
-        # First line is "Text", second is "More"
-        assert result.line_features[0].line_length == 4
-        assert result.line_features[1].line_length == 4
 
 
 class TestStructuralFeatures:
@@ -160,96 +126,75 @@ class TestStructuralFeatures:
 
     def test_quote_depth_passed_through(self) -> None:
         """Quote depth from structural analysis is preserved."""
-        result = _extract_features("> Quoted")
+        result, _ = extract_features("> Quoted")
 
         assert result.line_features[0].quote_depth == 1
 
     def test_delimiter_flags_passed_through(self) -> None:
         """Delimiter flags from structural analysis are preserved."""
-        result = _extract_features("Text\n---\nMore")
+        result, _ = extract_features("Text\n---\nMore")
 
         assert result.line_features[1].is_delimiter is True
         assert result.line_features[2].preceded_by_delimiter is True
 
 
-class TestPatternFlags:
-    """Pattern flag detection tests."""
-
-    def test_greeting_detection(self) -> None:
-        """Greeting patterns are detected."""
-        result = _extract_features("お世話になっております。")
-
-        assert result.line_features[0].is_greeting is True
-
-    def test_closing_detection(self) -> None:
-        """Closing patterns are detected."""
-        result = _extract_features("よろしくお願いいたします。")
-
-        assert result.line_features[0].is_closing is True
-
-    def test_contact_info_detection_phone(self) -> None:
-        """Phone patterns are detected."""
-        result = _extract_features("TEL: 03-1234-5678")
-
-        assert result.line_features[0].has_contact_info is True
-
-    def test_contact_info_detection_email(self) -> None:
-        """Email patterns are detected."""
-        result = _extract_features("test@example.com")
-
-        assert result.line_features[0].has_contact_info is True
-
-    def test_contact_info_detection_url(self) -> None:
-        """URL patterns are detected."""
-        result = _extract_features("https://example.com")
-
-        assert result.line_features[0].has_contact_info is True
-
-    def test_company_pattern_detection(self) -> None:
-        """Company suffix patterns are detected."""
-        result = _extract_features("株式会社テスト")
-
-        assert result.line_features[0].has_company_pattern is True
-
-    def test_company_pattern_abbreviation(self) -> None:
-        """Abbreviated company patterns are detected."""
-        result = _extract_features("(株)テスト")
+# Pattern flag expectations as (text, flag name, expected) for single-line inputs
+_PATTERN_FLAG_CASES: tuple[tuple[str, str, bool], ...] = (
+    # Greetings
+    ("お世話になっております。", "is_greeting", True),
+    ("お世話になります。", "is_greeting", True),
+    ("お疲れ様です。", "is_greeting", True),
+    ("拝啓、貴社ますます", "is_greeting", True),
+    ("田中様", "is_greeting", True),  # Addressee pattern
+    # Closings
+    ("よろしくお願いいたします。", "is_closing", True),
+    ("敬具", "is_closing", True),
+    ("以上です。", "is_closing", True),
+    # Contact info: phone, email, URL, postal code
+    ("TEL: 03-1234-5678", "has_contact_info", True),
+    ("03-1234-5678", "has_contact_info", True),
+    ("test@example.com", "has_contact_info", True),
+    ("https://example.com", "has_contact_info", True),
+    ("〒100-0001", "has_contact_info", True),
+    # Company suffixes, including the abbreviated form
+    ("株式会社テスト", "has_company_pattern", True),
+    ("株式会社ABC", "has_company_pattern", True),
+    ("(株)テスト", "has_company_pattern", True),
+    # Position/title
+    ("営業部長", "has_position_pattern", True),
+    # Visual separators
+    ("----------", "is_visual_separator", True),
+    # Meta-discussion markers
+    ("例えば以下のように", "has_meta_discussion", True),
+    # Quotation marks
+    ("「これはサンプルです」", "is_inside_quotation_marks", True),
+    # Normal body text has no pattern flags
+    ("明日の会議について確認させてください。", "is_greeting", False),
+    ("明日の会議について確認させてください。", "is_closing", False),
+    ("明日の会議について確認させてください。", "has_contact_info", False),
+    ("明日の会議について確認させてください。", "has_company_pattern", False),
+)
 
-        assert result.line_features[0].has_company_pattern is True
 
-    def test_position_pattern_detection(self) -> None:
-        """Position/title patterns are detected."""
-        result = _extract_features("営業部長")
-
-        assert result.line_features[0].has_position_pattern is True
-
-    def test_visual_separator_detection(self) -> None:
-        """Visual separators are detected."""
-        result = _extract_features("----------")
-
-        assert result.line_features[0].is_visual_separator is True
-
-    def test_meta_discussion_detection(self) -> None:
-        """Meta-discussion markers are detected."""
-        result = _extract_features("例えば以下のように")
-
-        assert result.line_features[0].has_meta_discussion is True
+class TestPatternFlags:
+    """Pattern flag detection tests."""
 
-    def test_quotation_marks_detection(self) -> None:
-        """Lines with quotation marks are detected."""
-        result = _extract_features("「これはサンプルです」")
+    @pytest.mark.parametrize(("text", "attr", "expected"), _PATTERN_FLAG_CASES)
+    def test_pattern_flag(self, text: str, attr: str, expected: bool) -> None:
+        """Single-line inputs set the expected pattern flag."""
+        # Line-local flags only need normalization, not filtering or structural analysis
+        line = NORMALIZER.normalize(text).lines[0]
 
-        assert result.line_features[0].is_inside_quotation_marks is True
+        assert EXTRACTOR.match_patterns(line)[attr] is expected
 
-    def test_normal_text_no_flags(self) -> None:
-        """Normal body text has no pattern flags."""
-        result = _extract_features("明日の会議について確認させてください。")
+    def test_match_patterns_agrees_with_extract(self) -> None:
+        """match_patterns returns the same flags the full pipeline stores."""
+        text = "お世話になっております。"
+        features = extract_features(text)[0].line_features[0]
+        flags = EXTRACTOR.match_patterns(NORMALIZER.normalize(text).lines[0])
 
-        features = result.line_features[0]
-        assert features.is_greeting is False
-        assert features.is_closing is False
-        assert features.has_contact_info is False
-        assert features.has_company_pattern is False
+        for name, value in flags.items():
+            assert getattr(features, name) is value
 
 
 class TestContextualFeatures:
@@ -258,7 +203,7 @@ class TestContextualFeatures:
     def test_context_greeting_count(self) -> None:
         """Greeting count in context window."""
         text = "お世話になっております。\n本文です。\nいつもお世話になっております。"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Middle line should see 2 greetings in its context
         assert result.line_features[1].context_greeting_count == 2
@@ -268,24 +213,19 @@ class TestContextualFeatures:
         # Note: leading/trailing blanks are removed by normalizer
         # Internal blanks between content lines are preserved
         text = "First\n\n\nSecond\n\nThird"
-        result = _extract_features(text)
-
-        # Three content lines after filtering
-        assert len(result.line_features) == 3
-        # First line has no blanks before, 2 blanks after
-        assert result.line_features[0].blank_lines_before == 0
-        assert result.line_features[0].blank_lines_after == 2
-        # Second line has 2 blanks before, 1 blank after
-        assert result.line_features[1].blank_lines_before == 2
-        assert result.line_features[1].blank_lines_after == 1
-        # Third line has 1 blank before, no blanks after
-        assert result.line_features[2].blank_lines_before == 1
-        assert result.line_features[2].blank_lines_after == 0
+        result, _ = extract_features(text)
+
+        # Three content lines after filtering; (blank_lines_before, blank_lines_after) per line
+        assert [(f.blank_lines_before, f.blank_lines_after) for f in result.line_features] == [
+            (0, 2),
+            (2, 1),
+            (1, 0),
+        ]
 
     def test_context_quote_count(self) -> None:
         """Quote count in context window."""
         text = "Normal\n> Quote1\n> Quote2\n> Quote3\nNormal"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Line at index 2 should see quotes around it
         assert result.line_features[2].context_quote_count >= 2
@@ -293,7 +233,7 @@ class TestContextualFeatures:
     def test_context_excludes_self(self) -> None:
         """Context features exclude the line itself."""
         text = "お世話になっております。"  # Just a greeting
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # The greeting line itself should have 0 context greetings
         assert result.line_features[0].context_greeting_count == 0
@@ -318,33 +258,18 @@ ABC株式会社の山田です。
 ABC株式会社
 TEL: 03-1234-5678"""
 
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Verify total lines
         assert result.total_lines > 0
 
-        # Find greeting line
-        greeting_lines = [
-            f for f in result.line_features if f.is_greeting
-        ]
-        assert len(greeting_lines) >= 1
-
-        # Find closing line
-        closing_lines = [
-            f for f in result.line_features if f.is_closing
-        ]
-        assert len(closing_lines) >= 1
+        # Find greeting and closing lines
+        assert any(f.is_greeting for f in result.line_features)
+        assert any(f.is_closing for f in result.line_features)
 
         # Find signature area (contact info, company)
-        contact_lines = [
-            f for f in result.line_features if f.has_contact_info
-        ]
-        assert len(contact_lines) >= 1
-
-        company_lines = [
-            f for f in result.line_features if f.has_company_pattern
-        ]
-        assert len(company_lines) >= 1
+        assert any(f.has_contact_info for f in result.line_features)
+        assert any(f.has_company_pattern for f in result.line_features)
 
     def test_reply_email_features(self) -> None:
         """Feature extraction on a reply email."""
@@ -357,104 +282,25 @@ On 2024/01/15, Tanaka wrote:
 
 よろしくお願いします。"""
 
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Should detect quote context
-        quote_features = [
-            f for f in result.line_features if f.quote_depth > 0
-        ]
-        assert len(quote_features) >= 1
+        assert any(f.quote_depth > 0 for f in result.line_features)
 
         # Lines near quotes should have context_quote_count > 0
-        non_quote_with_context = [
-            f for f in result.line_features
-            if f.quote_depth == 0 and f.context_quote_count > 0
-        ]
-        assert len(non_quote_with_context) >= 1
+        assert any(f.quote_depth == 0 and f.context_quote_count > 0 for f in result.line_features)
 
     def test_minimal_input_features(self) -> None:
         """Minimal input produces expected features."""
-        normalizer = Normalizer()
-        content_filter = ContentFilter()
-        analyzer = StructuralAnalyzer()
-        extractor = FeatureExtractor()
-
         # Normalize a minimal valid input
-        normalized = normalizer.normalize("x")
-        filtered = content_filter.filter(normalized)
-        analysis = analyzer.analyze(filtered)
-        result = extractor.extract(analysis, filtered)
+        normalized = NORMALIZER.normalize("x")
+        filtered = CONTENT_FILTER.filter(normalized)
+        analysis = ANALYZER.analyze(filtered)
+        result = EXTRACTOR.extract(analysis, filtered)
 
         assert result.total_lines == 1
 
 
-class TestGreetingPatterns:
-    """Tests for greeting pattern detection."""
-
-    def test_osewa_ni_natte_orimasu(self) -> None:
-        """お世話になっております is detected."""
-        result = _extract_features("お世話になっております。")
-        assert result.line_features[0].is_greeting is True
-
-    def test_osewa_ni_narimasu(self) -> None:
-        """お世話になります is detected."""
-        result = _extract_features("お世話になります。")
-        assert result.line_features[0].is_greeting is True
-
-    def test_otsukare_sama(self) -> None:
-        """お疲れ様です is detected."""
-        result = _extract_features("お疲れ様です。")
-        assert result.line_features[0].is_greeting is True
-
-    def test_haikei(self) -> None:
-        """拝啓 is detected."""
-        result = _extract_features("拝啓、貴社ますます")
-        assert result.line_features[0].is_greeting is True
-
-    def test_addressee_pattern(self) -> None:
-        """Addressee patterns like 様 are detected."""
-        result = _extract_features("田中様")
-        assert result.line_features[0].is_greeting is True
-
-
-class TestClosingPatterns:
-    """Tests for closing pattern detection."""
-
-    def test_yoroshiku_onegai_itashimasu(self) -> None:
-        """よろしくお願いいたします is detected."""
-        result = _extract_features("よろしくお願いいたします。")
-        assert result.line_features[0].is_closing is True
-
-    def test_keigu(self) -> None:
-        """敬具 is detected."""
-        result = _extract_features("敬具")
-        assert result.line_features[0].is_closing is True
-
-    def test_ijou(self) -> None:
-        """以上 is detected."""
-        result = _extract_features("以上です。")
-        assert result.line_features[0].is_closing is True
-
-
-class TestSignaturePatterns:
-    """Tests for signature-related pattern detection."""
-
-    def test_kabushiki_gaisha(self) -> None:
-        """株式会社 is detected."""
-        result = _extract_features("株式会社ABC")
-        assert result.line_features[0].has_company_pattern is True
-
-    def test_phone_number(self) -> None:
-        """Phone number patterns are detected."""
-        result = _extract_features("03-1234-5678")
-        assert result.line_features[0].has_contact_info is True
-
-    def test_postal_code(self) -> None:
-        """Postal code patterns are detected."""
-        result = _extract_features("〒100-0001")
-        assert result.line_features[0].has_contact_info is True
-
-
 class TestSeparatorsMatch:
     """Tests for the _separators_match helper function."""
 
@@ -508,7 +354,7 @@ class TestBracketedSectionDetection:
     def test_simple_bracketed_section(self) -> None:
         """Lines between matching separators are marked as bracketed."""
         text = "Before\n========\nInside section\n========\nAfter"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Line indices: 0=Before, 1=======, 2=Inside, 3========, 4=After
         assert result.line_features[0].in_bracketed_section is False  # Before
@@ -520,7 +366,7 @@ class TestBracketedSectionDetection:
     def test_signature_without_closing_separator(self) -> None:
         """Lines after a single separator (no closer) are not bracketed."""
         text = "Body text\n---\n山田太郎\nABC株式会社"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # No closing separator, so nothing should be bracketed
         for lf in result.line_features:
@@ -529,7 +375,7 @@ class TestBracketedSectionDetection:
     def test_bracketed_info_block_with_signature_patterns(self) -> None:
         """Info block with contact info propagates signature pattern flag."""
         text = "★---------------------★\n【添付ファイルについて】\nhttps://example.com/mypage\n★---------------------★"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Lines 1 and 2 are inside brackets
         assert result.line_features[1].in_bracketed_section is True
@@ -541,7 +387,7 @@ class TestBracketedSectionDetection:
     def test_bracketed_section_without_signature_patterns(self) -> None:
         """Info block without signature patterns has flag as False."""
         text = "========\n会議の詳細\n日時：明日10時\n========"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Lines inside brackets
         inside_lines = [lf for lf in result.line_features if lf.in_bracketed_section]
@@ -553,7 +399,7 @@ class TestBracketedSectionDetection:
     def test_multiple_bracketed_sections(self) -> None:
         """Multiple distinct bracketed sections are detected."""
         text = "---\nFirst block\n---\nMiddle\n===\nSecond block\n==="
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # First block lines
         assert result.line_features[1].in_bracketed_section is True  # First block
@@ -565,7 +411,7 @@ class TestBracketedSectionDetection:
     def test_similar_separators_match_for_brackets(self) -> None:
         """Separators with similar character distribution form brackets."""
         text = "-----=====\nContent here\n--=-=-=-=-"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Content should be bracketed (separators have same char distribution)
         assert result.line_features[1].in_bracketed_section is True
@@ -573,7 +419,7 @@ class TestBracketedSectionDetection:
     def test_dissimilar_separators_no_bracket(self) -> None:
         """Dissimilar separators do not form brackets."""
         text = "========\nContent here\n--------"
-        result = _extract_features(text)
+        result, _ = extract_features(text)
 
         # Content should NOT be bracketed (different characters)
         assert result.line_features[1].in_bracketed_section is False
@@ -1,9 +1,12 @@
 """Tests for Reconstructor component."""
 
-from yomail.pipeline.content_filter import ContentFilter, WhitespaceMap
+import pytest
+
+from tests._pipeline import CONTENT_FILTER, RECONSTRUCTOR
+from yomail.pipeline.content_filter import WhitespaceMap
 from yomail.pipeline.crf import Label, LabeledLine, SequenceLabelingResult
 from yomail.pipeline.normalizer import NormalizedEmail
-from yomail.pipeline.reconstructor import ReconstructedLine, Reconstructor
+from yomail.pipeline.reconstructor import ReconstructedLine
 
 
 def _make_normalized(text: str) -> NormalizedEmail:
@@ -32,50 +35,42 @@ def _make_labeling(labels: list[tuple[str, Label, float]]) -> SequenceLabelingRe
 class TestReconstructor:
     """Tests for document reconstruction."""
 
-    def test_no_blanks_passthrough(self) -> None:
-        """No blanks means labels pass through unchanged."""
-        whitespace_map = WhitespaceMap(
-            content_to_original=(0, 1, 2),
-            blank_positions=frozenset(),
-            original_line_count=3,
-        )
-        labeling = _make_labeling([
-            ("Line 1", "BODY", 0.9),
-            ("Line 2", "BODY", 0.8),
-            ("Line 3", "CLOSING", 0.95),
-        ])
-
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
-            labeling, whitespace_map, ("Line 1", "Line 2", "Line 3")
-        )
-
-        assert len(result.lines) == 3
-        assert all(not line.is_blank for line in result.lines)
-        assert result.lines[0].label == "BODY"
-        assert result.lines[2].label == "CLOSING"
-
-    def test_blank_lines_reinserted(self) -> None:
-        """Blank lines are reinserted with is_blank=True."""
+    @pytest.mark.parametrize(
+        ("original_lines", "content_labels", "expected_labels"),
+        [
+            # No blanks: labels pass through unchanged
+            (("Line 1", "Line 2", "Line 3"), ("BODY", "BODY", "CLOSING"), ("BODY", "BODY", "CLOSING")),
+            # Single blank reinserted between content lines
+            (("Line 1", "", "Line 2"), ("BODY", "BODY"), ("BODY", "BODY", "BODY")),
+            # Consecutive blanks all inherit the same preceding label
+            (("First", "", "", "", "Second"), ("BODY", "SIGNATURE"), ("BODY", "BODY", "BODY", "BODY", "SIGNATURE")),
+            # Leading blanks have no preceding label
+            (("", "", "Content"), ("BODY",), (None, None, "BODY")),
+            # Trailing blanks inherit the last content label
+            (("Content", "", ""), ("BODY",), ("BODY", "BODY", "BODY")),
+        ],
+    )
+    def test_blank_lines_reinserted(
+        self,
+        original_lines: tuple[str, ...],
+        content_labels: tuple[Label, ...],
+        expected_labels: tuple[Label | None, ...],
+    ) -> None:
+        """Blank lines are reinserted with is_blank=True and the preceding content label."""
+        content_to_original = tuple(idx for idx, text in enumerate(original_lines) if text)
         whitespace_map = WhitespaceMap(
-            content_to_original=(0, 2),
-            blank_positions=frozenset({1}),
-            original_line_count=3,
+            content_to_original=content_to_original,
+            blank_positions=frozenset(range(len(original_lines))).difference(content_to_original),
+            original_line_count=len(original_lines),
         )
         labeling = _make_labeling([
-            ("Line 1", "BODY", 0.9),
-            ("Line 2", "BODY", 0.8),
+            (original_lines[idx], label, 0.9) for idx, label in zip(content_to_original, content_labels, strict=True)
         ])
 
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
-            labeling, whitespace_map, ("Line 1", "", "Line 2")
-        )
+        result = RECONSTRUCTOR.reconstruct(labeling, whitespace_map, original_lines)
 
-        assert len(result.lines) == 3
-        assert result.lines[0].is_blank is False
-        assert result.lines[1].is_blank is True
-        assert result.lines[2].is_blank is False
+        assert tuple(line.is_blank for line in result.lines) == tuple(not text for text in original_lines)
+        assert tuple(line.label for line in result.lines) == expected_labels
 
     def test_blank_lines_inherit_preceding_label(self) -> None:
         """Blank lines inherit the preceding content line's label."""
@@ -89,8 +84,7 @@ class TestReconstructor:
             ("Line 2", "CLOSING", 0.8),
         ])
 
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
+        result = RECONSTRUCTOR.reconstruct(
             labeling, whitespace_map, ("Line 1", "", "Line 2")
         )
 
@@ -100,30 +94,6 @@ class TestReconstructor:
         assert result.lines[1].confidence is None
         assert result.lines[1].label_probabilities is None
 
-    def test_multiple_blanks_inherit_same_label(self) -> None:
-        """Multiple consecutive blank lines all inherit the same preceding label."""
-        whitespace_map = WhitespaceMap(
-            content_to_original=(0, 4),
-            blank_positions=frozenset({1, 2, 3}),
-            original_line_count=5,
-        )
-        labeling = _make_labeling([
-            ("First", "BODY", 0.9),
-            ("Second", "SIGNATURE", 0.8),
-        ])
-
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
-            labeling, whitespace_map, ("First", "", "", "", "Second")
-        )
-
-        # All blank lines inherit BODY from the first content line
-        assert result.lines[1].label == "BODY"
-        assert result.lines[2].label == "BODY"
-        assert result.lines[3].label == "BODY"
-        # The second content line has its own label
-        assert result.lines[4].label == "SIGNATURE"
-
     def test_original_index_correct(self) -> None:
         """All lines have correct original_index."""
         whitespace_map = WhitespaceMap(
@@ -136,8 +106,7 @@ class TestReconstructor:
             ("B", "BODY", 0.8),
         ])
 
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
+        result = RECONSTRUCTOR.reconstruct(
             labeling, whitespace_map, ("A", "", "", "B")
         )
 
@@ -146,47 +115,6 @@ class TestReconstructor:
         assert result.lines[2].original_index == 2
         assert result.lines[3].original_index == 3
 
-    def test_leading_blanks(self) -> None:
-        """Blank lines at start of document."""
-        whitespace_map = WhitespaceMap(
-            content_to_original=(2,),
-            blank_positions=frozenset({0, 1}),
-            original_line_count=3,
-        )
-        labeling = _make_labeling([
-            ("Content", "BODY", 0.9),
-        ])
-
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
-            labeling, whitespace_map, ("", "", "Content")
-        )
-
-        assert result.lines[0].is_blank is True
-        assert result.lines[1].is_blank is True
-        assert result.lines[2].is_blank is False
-        assert result.lines[2].label == "BODY"
-
-    def test_trailing_blanks(self) -> None:
-        """Blank lines at end of document."""
-        whitespace_map = WhitespaceMap(
-            content_to_original=(0,),
-            blank_positions=frozenset({1, 2}),
-            original_line_count=3,
-        )
-        labeling = _make_labeling([
-            ("Content", "BODY", 0.9),
-        ])
-
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
-            labeling, whitespace_map, ("Content", "", "")
-        )
-
-        assert result.lines[0].label == "BODY"
-        assert result.lines[1].is_blank is True
-        assert result.lines[2].is_blank is True
-
     def test_sequence_probability_preserved(self) -> None:
         """sequence_probability is passed through."""
         whitespace_map = WhitespaceMap(
@@ -201,8 +129,7 @@ class TestReconstructor:
             sequence_probability=0.75,
         )
 
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(labeling, whitespace_map, ("X",))
+        result = RECONSTRUCTOR.reconstruct(labeling, whitespace_map, ("X",))
 
         assert result.sequence_probability == 0.75
 
@@ -218,8 +145,7 @@ class TestReconstructor:
             ("World", "BODY", 0.8),
         ])
 
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
+        result = RECONSTRUCTOR.reconstruct(
             labeling, whitespace_map, ("Hello", "   ", "World")
         )
 
@@ -236,16 +162,14 @@ class TestRoundTrip:
         text = "A\n\nB\nC\n\nD"
         normalized = _make_normalized(text)
 
-        filter_ = ContentFilter()
-        filtered = filter_.filter(normalized)
+        filtered = CONTENT_FILTER.filter(normalized)
 
         # Create fake labels for content lines
         labeling = _make_labeling([
             (line.text, "BODY", 0.9) for line in filtered.content_lines
         ])
 
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
+        result = RECONSTRUCTOR.reconstruct(
             labeling, filtered.whitespace_map, filtered.original_lines
         )
 
@@ -256,15 +180,13 @@ class TestRoundTrip:
         text = "A\n\nB\n\n\nC"
         normalized = _make_normalized(text)
 
-        filter_ = ContentFilter()
-        filtered = filter_.filter(normalized)
+        filtered = CONTENT_FILTER.filter(normalized)
 
         labeling = _make_labeling([
             (line.text, "BODY", 0.9) for line in filtered.content_lines
         ])
 
-        reconstructor = Reconstructor()
-        result = reconstructor.reconstruct(
+        result = RECONSTRUCTOR.reconstruct(
             labeling, filtered.whitespace_map, filtered.original_lines
         )
 
@@ -285,8 +207,5 @@ class TestReconstructedLine:
             confidence=0.9,
             label_probabilities={"BODY": 0.9},
         )
-        try:
+        with pytest.raises(AttributeError):
             line.text = "Changed"  # type: ignore[misc]
-            assert False, "Should not allow mutation"
-        except AttributeError:
-            pass  # Expected
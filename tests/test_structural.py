@@ -1,70 +1,39 @@
 """Tests for the StructuralAnalyzer component."""
 
-from yomail import Normalizer, StructuralAnalyzer
-from yomail.pipeline.content_filter import ContentFilter
+import pytest
+
+from tests._pipeline import ANALYZER, CONTENT_FILTER, NORMALIZER
 from yomail.pipeline.structural import StructuralAnalysis
 
 
 def _analyze(text: str) -> StructuralAnalysis:
     """Helper to run the full analysis pipeline."""
-    normalizer = Normalizer()
-    content_filter = ContentFilter()
-    analyzer = StructuralAnalyzer()
-
-    normalized = normalizer.normalize(text)
-    filtered = content_filter.filter(normalized)
-    return analyzer.analyze(filtered)
+    normalized = NORMALIZER.normalize(text)
+    filtered = CONTENT_FILTER.filter(normalized)
+    return ANALYZER.analyze(filtered)
 
 
 class TestQuoteDepth:
     """Quote depth detection tests."""
 
-    def test_no_quotes(self) -> None:
-        """Lines without quote markers have depth 0."""
-        result = _analyze("Hello\nWorld")
-
-        assert result.lines[0].quote_depth == 0
-        assert result.lines[1].quote_depth == 0
-        assert result.has_quotes is False
-
-    def test_single_quote_marker(self) -> None:
-        """Single > marker gives depth 1."""
-        result = _analyze("> Quoted text")
-
-        assert result.lines[0].quote_depth == 1
-        assert result.has_quotes is True
-
-    def test_nested_quotes(self) -> None:
-        """Multiple > markers give corresponding depth."""
-        result = _analyze(">> Nested quote\n>>> Triple nested")
-
-        assert result.lines[0].quote_depth == 2
-        assert result.lines[1].quote_depth == 3
-
-    def test_quote_with_space(self) -> None:
-        """Quote markers with spaces between them."""
-        result = _analyze("> > Spaced quotes")
-
-        assert result.lines[0].quote_depth == 2
-
-    def test_pipe_quote_marker(self) -> None:
-        """Pipe | is also a quote marker."""
-        result = _analyze("| Pipe quoted")
-
-        assert result.lines[0].quote_depth == 1
-
-    def test_mixed_quote_markers(self) -> None:
-        """Mixed > and | markers."""
-        result = _analyze(">| Mixed markers")
-
-        assert result.lines[0].quote_depth == 2
-
-    def test_fullwidth_quote_normalized(self) -> None:
-        """Full-width ＞ is normalized to > before analysis."""
-        # Full-width ＞ should be normalized to half-width >
-        result = _analyze("＞ Full-width quote")
+    @pytest.mark.parametrize(
+        ("text", "expected_depths"),
+        [
+            ("Hello\nWorld", (0, 0)),  # No quote markers
+            ("> Quoted text", (1,)),  # Single > marker
+            (">> Nested quote\n>>> Triple nested", (2, 3)),  # Nested markers
+            ("> > Spaced quotes", (2,)),  # Spaces between markers
+            ("| Pipe quoted", (1,)),  # Pipe is also a quote marker
+            (">| Mixed markers", (2,)),  # Mixed > and |
+            ("＞ Full-width quote", (1,)),  # Full-width ＞ normalized to >
+        ],
+    )
+    def test_quote_depth(self, text: str, expected_depths: tuple[int, ...]) -> None:
+        """Quote depth counts the quote markers at the start of each line."""
+        result = _analyze(text)
 
-        assert result.lines[0].quote_depth == 1
+        assert tuple(line.quote_depth for line in result.lines) == expected_depths
+        assert result.has_quotes is any(expected_depths)
 
     def test_quote_indices(self) -> None:
         """First and last quote indices are tracked."""
@@ -77,31 +46,22 @@ class TestQuoteDepth:
 class TestDelimiterDetection:
     """Delimiter line detection tests."""
 
-    def test_hyphen_delimiter(self) -> None:
-        """Hyphen delimiter line is detected."""
-        result = _analyze("Before\n---\nAfter")
+    @pytest.mark.parametrize(
+        "delimiter",
+        [
+            "---",  # Hyphens
+            "===",  # Equals
+            "___",  # Underscores
+            "-" * 50,  # Long delimiter
+        ],
+    )
+    def test_delimiter_detected(self, delimiter: str) -> None:
+        """Delimiter lines are detected and mark the following line."""
+        result = _analyze(f"Before\n{delimiter}\nAfter")
 
         assert result.lines[1].is_delimiter is True
         assert result.lines[2].preceded_by_delimiter is True
 
-    def test_equals_delimiter(self) -> None:
-        """Equals delimiter line is detected."""
-        result = _analyze("Before\n===\nAfter")
-
-        assert result.lines[1].is_delimiter is True
-
-    def test_underscore_delimiter(self) -> None:
-        """Underscore delimiter line is detected."""
-        result = _analyze("Before\n___\nAfter")
-
-        assert result.lines[1].is_delimiter is True
-
-    def test_long_delimiter(self) -> None:
-        """Long delimiter line is detected."""
-        result = _analyze("Before\n" + "-" * 50 + "\nAfter")
-
-        assert result.lines[1].is_delimiter is True
-
     def test_short_text_not_delimiter(self) -> None:
         """Short sequences of delimiter chars are not delimiters."""
         result = _analyze("a--b")
@@ -123,37 +83,23 @@ class TestDelimiterDetection:
 class TestForwardReplyHeaders:
     """Forward/reply header detection tests."""
 
-    def test_original_message_header(self) -> None:
-        """-----Original Message----- is detected."""
-        result = _analyze("Reply\n-----Original Message-----\n> Old")
+    @pytest.mark.parametrize(
+        "header",
+        [
+            "-----Original Message-----",
+            "---------- Forwarded message ----------",
+            "On 2024/01/15, John Smith wrote:",
+            "2024年1月15日 田中太郎:",  # Japanese date attribution
+            "田中さんからのメール:",  # Japanese さんからのメール
+        ],
+    )
+    def test_header_detected(self, header: str) -> None:
+        """Forward/reply attribution lines are detected."""
+        result = _analyze(f"Reply\n{header}\n> Old")
 
         assert result.lines[1].is_forward_reply_header is True
         assert result.has_forward_reply is True
 
-    def test_forwarded_message_header(self) -> None:
-        """---------- Forwarded message --------- is detected."""
-        result = _analyze("FYI\n---------- Forwarded message ----------")
-
-        assert result.lines[1].is_forward_reply_header is True
-
-    def test_on_date_wrote_header(self) -> None:
-        """On [date] [person] wrote: is detected."""
-        result = _analyze("On 2024/01/15, John Smith wrote:")
-
-        assert result.lines[0].is_forward_reply_header is True
-
-    def test_japanese_date_header(self) -> None:
-        """Japanese date format attribution is detected."""
-        result = _analyze("2024年1月15日 田中太郎:")
-
-        assert result.lines[0].is_forward_reply_header is True
-
-    def test_japanese_san_wrote_header(self) -> None:
-        """Japanese さんからのメール pattern is detected."""
-        result = _analyze("田中さんからのメール:")
-
-        assert result.lines[0].is_forward_reply_header is True
-
     def test_normal_text_not_header(self) -> None:
         """Normal text is not mistaken for forward/reply header."""
         result = _analyze("お世話になっております。")
@@ -183,11 +129,8 @@ class TestAnnotatedLineDataclass:
         """AnnotatedLine is immutable."""
         result = _analyze("Test")
 
-        try:
+        with pytest.raises(AttributeError):
             result.lines[0].quote_depth = 5  # type: ignore[misc]
-            raise AssertionError("Should have raised")
-        except AttributeError:
-            pass  # Expected
 
 
 class TestIntegration: